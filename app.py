@@ -4,13 +4,132 @@ eCourts Scraper - Web Interface (Bonus Feature)
 Simple Flask-based web interface for the scraper
 """
 
-from flask import Flask, render_template_string, request, jsonify, send_file
-from ecourts_scraper import ECourtsScraper
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import JSONProvider
+from ecourts_scraper import ECourtsScraper, normalise_cnr
+from cachetools import TTLCache
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from werkzeug.exceptions import RequestEntityTooLarge
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+import brotli
+import gzip
+import hashlib
+import msgspec
+import orjson
 import os
+import pybreaker
+import re
+import threading
+import time
+import uuid
+from typing import Optional
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, so jsonify() encodes in C"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+class SearchRequest(msgspec.Struct):
+    """Body of POST /api/search"""
+    searchType: str = 'cnr'
+    cnr: Optional[str] = None
+    state: Optional[str] = None
+    dist: Optional[str] = None
+    court: Optional[str] = None
+    caseType: Optional[str] = None
+    caseNo: Optional[str] = None
+    caseYear: Optional[str] = None
+    checkDate: Optional[str] = None
+    downloadPdf: bool = False
+    downloadCauseList: bool = False
 
 app = Flask(__name__)
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
+app.json = OrjsonProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = 4096  # search payloads are a few hundred bytes
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 30 * 24 * 3600  # static/ URLs are versioned
+app.config['USE_X_ACCEL_REDIRECT'] = os.environ.get('ECOURTS_X_ACCEL_REDIRECT') == '1'
+
+# Per-client request limits (in-memory, matching the single worker process)
+limiter = Limiter(get_remote_address, app=app, storage_uri='memory://')
+
+# Stop sending searches to eCourts for a minute after 5 upstream failures in a row
+class _BreakerOpenedAt(pybreaker.CircuitBreakerListener):
+    """Remember when the breaker last opened, so search() can reject early"""
+    opened_at = 0.0
+    
+    def state_change(self, cb, old_state, new_state):
+        if new_state.name == pybreaker.STATE_OPEN:
+            self.opened_at = time.monotonic()
+
+_BREAKER_OPENED = _BreakerOpenedAt()
+BREAKER = pybreaker.CircuitBreaker(fail_max=5, reset_timeout=60, listeners=[_BREAKER_OPENED])
+
+def _upstream_down():
+    """True while the breaker is open and its reset timeout has not elapsed"""
+    return (BREAKER.current_state == pybreaker.STATE_OPEN
+            and time.monotonic() - _BREAKER_OPENED.opened_at < BREAKER.reset_timeout)
+
+# Fixed error bodies, encoded once
+def _encode_error(message, status):
+    return orjson.dumps({'error': message}), status
+
+ERR_TOO_LARGE = _encode_error('Request body too large', 413)
+ERR_NO_DATA = _encode_error('No data provided', 400)
+ERR_CNR_REQUIRED = _encode_error('CNR number is required', 400)
+ERR_DIST_REQUIRED = _encode_error('District code is required for case number search', 400)
+ERR_UNKNOWN_JOB = _encode_error('Unknown job id', 404)
+ERR_RATE_LIMITED = _encode_error('Too many searches - slow down and try again shortly', 429)
+ERR_UPSTREAM_DOWN = _encode_error('eCourts is not responding - try again in a minute', 503)
+
+def _err(error):
+    """Build a JSON error response from a pre-encoded (body, status) pair"""
+    body, status = error
+    return Response(body, status=status, mimetype='application/json')
+
+# Background job queue - scraping runs off the request thread
+JOB_WORKERS = int(os.environ.get('ECOURTS_JOB_WORKERS', 8))
+JOB_TTL = 600  # seconds a finished job is kept for polling
+_JOB_POOL = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='scrape')
+_JOBS = {}
+_JOB_FINISHED = {}  # job id -> time.monotonic() it finished at
+_JOBS_LOCK = threading.Lock()
+
+# Separate pool for a job's downloads so jobs never wait on their own pool
+DOWNLOAD_WORKERS = 16
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix='download')
+
+# Shared scraper - one pooled session for all requests, with a keep-alive
+# connection for every thread that can be talking to eCourts at once
+# (job and download workers plus the cause-list refresher)
+SCRAPER = ECourtsScraper(pool_maxsize=JOB_WORKERS + DOWNLOAD_WORKERS + 1)
+
+# Recent case lookups - court data rarely changes within minutes
+CASE_CACHE_TTL = int(os.environ.get('ECOURTS_CACHE_TTL', 300))
+_CASE_CACHE = TTLCache(maxsize=10_000, ttl=CASE_CACHE_TTL)
+_CASE_CACHE_LOCK = threading.Lock()
+
+# Lookups currently being scraped, keyed like the cache
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Warm copies of today's cause list for every court users have asked about,
+# refreshed in the background so searches rarely wait on the download
+CAUSE_LIST_REFRESH = 600  # seconds between background refreshes
+CAUSE_LIST_TTL = 1800  # seconds a fetched cause list is served from the cache
+_KNOWN_COURTS = set()
+_CAUSE_LISTS = {}
+_CAUSE_LISTS_LOCK = threading.Lock()
+_cause_list_refresher = None
 
 # HTML Template
 HTML_TEMPLATE = """
@@ -20,233 +139,7 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>eCourts Scraper</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 800px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 16px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            padding: 40px;
-        }
-        
-        h1 {
-            color: #2d3748;
-            margin-bottom: 10px;
-            font-size: 32px;
-        }
-        
-        .subtitle {
-            color: #718096;
-            margin-bottom: 30px;
-        }
-        
-        .form-group {
-            margin-bottom: 20px;
-        }
-        
-        label {
-            display: block;
-            color: #4a5568;
-            font-weight: 600;
-            margin-bottom: 8px;
-        }
-        
-        input, select {
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            font-size: 16px;
-            transition: border-color 0.3s;
-        }
-        
-        input:focus, select:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-        
-        .search-type-tabs {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-        }
-        
-        .tab {
-            flex: 1;
-            padding: 12px;
-            background: #f7fafc;
-            border: 2px solid #e2e8f0;
-            border-radius: 8px;
-            cursor: pointer;
-            text-align: center;
-            font-weight: 600;
-            color: #4a5568;
-            transition: all 0.3s;
-        }
-        
-        .tab.active {
-            background: #667eea;
-            color: white;
-            border-color: #667eea;
-        }
-        
-        .form-section {
-            display: none;
-        }
-        
-        .form-section.active {
-            display: block;
-        }
-        
-        .checkbox-group {
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-        }
-        
-        .checkbox-label {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            cursor: pointer;
-        }
-        
-        .checkbox-label input[type="checkbox"] {
-            width: auto;
-        }
-        
-        button {
-            width: 100%;
-            padding: 14px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }
-        
-        button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(102, 126, 234, 0.4);
-        }
-        
-        button:active {
-            transform: translateY(0);
-        }
-        
-        button:disabled {
-            opacity: 0.6;
-            cursor: not-allowed;
-            transform: none;
-        }
-        
-        .results {
-            margin-top: 30px;
-            padding: 20px;
-            background: #f7fafc;
-            border-radius: 8px;
-            display: none;
-        }
-        
-        .results.show {
-            display: block;
-        }
-        
-        .result-header {
-            font-size: 20px;
-            font-weight: 600;
-            color: #2d3748;
-            margin-bottom: 15px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e2e8f0;
-        }
-        
-        .result-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 10px 0;
-            border-bottom: 1px solid #e2e8f0;
-        }
-        
-        .result-item:last-child {
-            border-bottom: none;
-        }
-        
-        .result-label {
-            font-weight: 600;
-            color: #4a5568;
-        }
-        
-        .result-value {
-            color: #2d3748;
-        }
-        
-        .success {
-            color: #48bb78;
-        }
-        
-        .error {
-            color: #f56565;
-        }
-        
-        .loading {
-            display: none;
-            text-align: center;
-            padding: 20px;
-        }
-        
-        .loading.show {
-            display: block;
-        }
-        
-        .spinner {
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 15px;
-        }
-        
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        
-        .alert {
-            padding: 15px;
-            border-radius: 8px;
-            margin-top: 20px;
-        }
-        
-        .alert-success {
-            background: #c6f6d5;
-            color: #22543d;
-        }
-        
-        .alert-error {
-            background: #fed7d7;
-            color: #742a2a;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/app.css?v=1">
 </head>
 <body>
     <div class="container">
@@ -335,237 +228,349 @@ HTML_TEMPLATE = """
         <div class="results" id="results"></div>
     </div>
     
-    <script>
-        // Tab switching
-        document.querySelectorAll('.tab').forEach(tab => {
-            tab.addEventListener('click', function() {
-                document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-                document.querySelectorAll('.form-section').forEach(s => s.classList.remove('active'));
-                
-                this.classList.add('active');
-                document.getElementById(this.dataset.tab + '-section').classList.add('active');
-            });
-        });
-        
-        // Form submission
-        document.getElementById('searchForm').addEventListener('submit', async function(e) {
-            e.preventDefault();
-            
-            const formData = new FormData(this);
-            const data = {};
-            
-            // Get active tab
-            const activeTab = document.querySelector('.tab.active').dataset.tab;
-            data.searchType = activeTab;
-            
-            // Collect form data
-            for (let [key, value] of formData.entries()) {
-                if (key === 'checkDate' || key === 'downloadPdf' || key === 'downloadCauseList') {
-                    data[key] = value;
-                } else if (value.trim()) {
-                    data[key] = value.trim();
-                }
-            }
-            
-            // Show loading
-            document.getElementById('loading').classList.add('show');
-            document.getElementById('results').classList.remove('show');
-            document.getElementById('submitBtn').disabled = true;
-            
-            try {
-                const response = await fetch('/api/search', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json'
-                    },
-                    body: JSON.stringify(data)
-                });
-                
-                const result = await response.json();
-                
-                // Hide loading
-                document.getElementById('loading').classList.remove('show');
-                document.getElementById('submitBtn').disabled = false;
-                
-                // Show results
-                displayResults(result);
-                
-            } catch (error) {
-                document.getElementById('loading').classList.remove('show');
-                document.getElementById('submitBtn').disabled = false;
-                displayError('Failed to connect to server: ' + error.message);
-            }
-        });
-        
-        function displayResults(data) {
-            const resultsDiv = document.getElementById('results');
-            
-            if (data.error) {
-                resultsDiv.innerHTML = `
-                    <div class="alert alert-error">
-                        <strong>Error:</strong> ${data.error}
-                    </div>
-                `;
-            } else {
-                let html = '<div class="result-header">Search Results</div>';
-                
-                if (data.case_info) {
-                    html += '<div class="result-item">';
-                    html += '<span class="result-label">Case ID:</span>';
-                    html += `<span class="result-value">${data.case_info.case_id}</span>`;
-                    html += '</div>';
-                    
-                    html += '<div class="result-item">';
-                    html += '<span class="result-label">Found:</span>';
-                    html += `<span class="result-value ${data.case_info.found ? 'success' : 'error'}">${data.case_info.found ? '✓ Yes' : '✗ No'}</span>`;
-                    html += '</div>';
-                    
-                    if (data.case_info.court_name) {
-                        html += '<div class="result-item">';
-                        html += '<span class="result-label">Court:</span>';
-                        html += `<span class="result-value">${data.case_info.court_name}</span>`;
-                        html += '</div>';
-                    }
-                    
-                    if (data.case_info.serial_number) {
-                        html += '<div class="result-item">';
-                        html += '<span class="result-label">Serial Number:</span>';
-                        html += `<span class="result-value">${data.case_info.serial_number}</span>`;
-                        html += '</div>';
-                    }
-                }
-                
-                if (data.listing_info) {
-                    html += '<div class="result-header" style="margin-top: 20px;">Listing Status</div>';
-                    
-                    html += '<div class="result-item">';
-                    html += '<span class="result-label">Check Date:</span>';
-                    html += `<span class="result-value">${data.listing_info.check_date}</span>`;
-                    html += '</div>';
-                    
-                    html += '<div class="result-item">';
-                    html += '<span class="result-label">Listed:</span>';
-                    html += `<span class="result-value ${data.listing_info.is_listed ? 'success' : 'error'}">${data.listing_info.is_listed ? '✓ Yes' : '✗ No'}</span>`;
-                    html += '</div>';
-                }
-                
-                if (data.downloads && data.downloads.length > 0) {
-                    html += '<div class="alert alert-success" style="margin-top: 20px;">';
-                    html += '<strong>Downloads:</strong><br>';
-                    data.downloads.forEach(d => {
-                        html += `${d.type}: ${d.file}<br>`;
-                    });
-                    html += '</div>';
-                }
-                
-                resultsDiv.innerHTML = html;
-            }
-            
-            resultsDiv.classList.add('show');
-        }
-        
-        function displayError(message) {
-            const resultsDiv = document.getElementById('results');
-            resultsDiv.innerHTML = `
-                <div class="alert alert-error">
-                    <strong>Error:</strong> ${message}
-                </div>
-            `;
-            resultsDiv.classList.add('show');
-        }
-    </script>
+    <template id="row-template">
+        <div class="result-item">
+            <span class="result-label"></span>
+            <span class="result-value"></span>
+        </div>
+    </template>
+    
+    <template id="alert-template">
+        <div class="alert"><strong></strong></div>
+    </template>
+    
+    <script src="/static/app.js?v=3"></script>
 </body>
 </html>
 """
 
+def _minify_html(html):
+    """Strip comments and collapse whitespace (the page has no <pre>/inline JS)"""
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    html = re.sub(r'\s+', ' ', html)
+    return re.sub(r'>\s+<', '><', html).strip()
+
+# The page has no template variables - minify and compress it once at import
+_INDEX_BYTES = _minify_html(HTML_TEMPLATE).encode('utf-8')
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES).hexdigest()
+_INDEX_ENCODED = {
+    'br': brotli.compress(_INDEX_BYTES, quality=11),
+    'gzip': gzip.compress(_INDEX_BYTES, 9),
+}
+
 @app.route('/')
 def index():
     """Render main page"""
-    return render_template_string(HTML_TEMPLATE)
+    # Honours q-values (br;q=0 means no brotli); brotli wins ties
+    encoding = request.accept_encodings.best_match(tuple(_INDEX_ENCODED))
+    
+    if encoding:
+        response = Response(_INDEX_ENCODED[encoding], mimetype='text/html')
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f'{_INDEX_ETAG}-{encoding}')
+    else:
+        response = Response(_INDEX_BYTES, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
-@app.route('/api/search', methods=['POST'])
-def search():
-    """API endpoint for case search"""
+def _fetch_cause_list(state, dist, court):
+    """Download today's cause list and keep it for later searches"""
+    date = datetime.now().strftime('%d-%m-%Y')
+    filename = SCRAPER.download_cause_list(state, dist, court, date)
+    if filename:
+        with _CAUSE_LISTS_LOCK:
+            _CAUSE_LISTS[(state, dist, court, date)] = (filename, time.monotonic())
+    return filename
+
+def _cached_cause_list(state, dist, court):
+    """Return today's cause list file if it was fetched recently"""
+    key = (state, dist, court, datetime.now().strftime('%d-%m-%Y'))
+    with _CAUSE_LISTS_LOCK:
+        entry = _CAUSE_LISTS.get(key)
+    if entry and time.monotonic() - entry[1] < CAUSE_LIST_TTL:
+        return entry[0]
+    return None
+
+def _refresh_cause_lists():
+    """Background loop re-fetching today's cause list for every known court"""
+    while True:
+        time.sleep(CAUSE_LIST_REFRESH)
+        
+        with _CAUSE_LISTS_LOCK:
+            courts = list(_KNOWN_COURTS)
+        
+        for state, dist, court in courts:
+            _fetch_cause_list(state, dist, court)
+        
+        # Forget lists that have gone stale (e.g. yesterday's)
+        now = time.monotonic()
+        with _CAUSE_LISTS_LOCK:
+            for key, (_, fetched) in list(_CAUSE_LISTS.items()):
+                if now - fetched > CAUSE_LIST_TTL:
+                    del _CAUSE_LISTS[key]
+
+def _register_court(state, dist, court):
+    """Add a court to the background refresh, starting the refresher if needed"""
+    global _cause_list_refresher
+    with _CAUSE_LISTS_LOCK:
+        _KNOWN_COURTS.add((state, dist, court))
+        if _cause_list_refresher is None:
+            _cause_list_refresher = threading.Thread(
+                target=_refresh_cause_lists, name='causelist-refresh', daemon=True
+            )
+            _cause_list_refresher.start()
+
+def _resolved(value):
+    """A Future that already holds value"""
+    fut = Future()
+    fut.set_result(value)
+    return fut
+
+class _UpstreamFailure(Exception):
+    """eCourts timed out, refused the connection or returned a 5xx"""
+    
+    def __init__(self, case_info):
+        super().__init__(case_info.get('error'))
+        self.case_info = case_info
+
+def _guarded_search(case_id, search_fn, *args):
+    """Run a scraper search through the circuit breaker"""
+    def attempt():
+        case_info = search_fn(*args)
+        error = (case_info or {}).get('error') or ''
+        if error in ('Request timeout', 'Connection failed') or error.startswith('HTTP 5'):
+            raise _UpstreamFailure(case_info)
+        return case_info
+    
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        scraper = ECourtsScraper()
-        
-        # Search case
-        if data.get('searchType') == 'cnr':
-            if not data.get('cnr'):
-                return jsonify({'error': 'CNR number is required'}), 400
-            
-            case_info = scraper.search_by_cnr(
-                data.get('state'),
-                data.get('cnr')
+        return BREAKER.call(attempt)
+    except _UpstreamFailure as e:
+        return e.case_info
+    except pybreaker.CircuitBreakerError:
+        # Same shape as the scraper's own not-found/error results
+        return SCRAPER._create_error_response(case_id, 'eCourts is not responding - try again in a minute')
+
+def _lookup_case(req):
+    """Fetch case details, reusing a recent result for the same query"""
+    state = req.state
+    if req.searchType == 'cnr':
+        key = ('cnr', state, normalise_cnr(req.cnr))
+    else:
+        key = ('case', state, req.dist,
+               req.caseType, req.caseNo, req.caseYear)
+    
+    with _CASE_CACHE_LOCK:
+        case_info = _CASE_CACHE.get(key)
+    if case_info is not None:
+        return case_info
+    
+    # Identical lookups already running share that scrape's result
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(key)
+        owner = fut is None
+        if owner:
+            fut = _INFLIGHT[key] = Future()
+    
+    if not owner:
+        return fut.result(timeout=60)
+    
+    try:
+        if key[0] == 'cnr':
+            case_info = _guarded_search(
+                req.cnr,
+                SCRAPER.search_by_cnr,
+                state,
+                req.cnr
             )
         else:
-            if not all([data.get('caseType'), data.get('caseNo'), data.get('caseYear')]):
-                return jsonify({'error': 'Case type, number, and year are required'}), 400
-            
-            if not data.get('dist'):
-                return jsonify({'error': 'District code is required for case number search'}), 400
-            
-            case_info = scraper.search_by_case_number(
-                data.get('state'),
-                data.get('dist'),
-                data.get('caseType'),
-                data.get('caseNo'),
-                data.get('caseYear')
-            )
-        
-        if not case_info:
-            return jsonify({'error': 'Failed to fetch case information'}), 500
+            # key already holds the case-number fields in call order
+            case_info = _guarded_search(f"{req.caseType}/{req.caseNo}/{req.caseYear}",
+                                        SCRAPER.search_by_case_number, *key[1:])
         
-        result = {
-            'case_info': case_info,
-            'downloads': []
-        }
+        # Only cache real hits - timeouts and CAPTCHA pages should be retried
+        if case_info and case_info.get('found'):
+            with _CASE_CACHE_LOCK:
+                _CASE_CACHE[key] = case_info
         
-        # Check listing
-        if data.get('checkDate'):
-            listing_info = scraper.check_listing(case_info, data.get('checkDate'))
-            result['listing_info'] = listing_info
-        
-        # Download PDF
-        if data.get('downloadPdf') and case_info.get('found'):
-            pdf_file = scraper.download_case_pdf(case_info['case_id'])
-            if pdf_file:
-                result['downloads'].append({'type': 'case_pdf', 'file': pdf_file})
-        
-        # Download cause list
-        if data.get('downloadCauseList'):
-            if data.get('dist') and data.get('court'):
-                causelist_file = scraper.download_cause_list(
-                    data.get('state'),
-                    data.get('dist'),
-                    data.get('court')
+        fut.set_result(case_info)
+        return case_info
+    except Exception as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+def scrape_case(req):
+    """Run a case search and the requested downloads (executed on the job pool)"""
+    scraper = SCRAPER
+    
+    # Search case
+    case_info = _lookup_case(req)
+    
+    if not case_info:
+        return {'error': 'Failed to fetch case information'}
+    
+    result = {
+        'case_info': case_info,
+        'downloads': []
+    }
+    
+    # Downloads are independent network calls - run them side by side
+    downloads = {}
+    
+    # Download PDF
+    if req.downloadPdf and case_info.get('found'):
+        downloads['case_pdf'] = _DOWNLOAD_POOL.submit(
+            scraper.download_case_pdf, case_info['case_id']
+        )
+    
+    # Download cause list (served from the warm cache when possible)
+    if req.downloadCauseList:
+        state, dist, court = req.state, req.dist, req.court
+        if dist and court:
+            _register_court(state, dist, court)
+            causelist_file = _cached_cause_list(state, dist, court)
+            if causelist_file:
+                downloads['cause_list'] = _resolved(causelist_file)
+            else:
+                downloads['cause_list'] = _DOWNLOAD_POOL.submit(
+                    _fetch_cause_list, state, dist, court
                 )
-                if causelist_file:
-                    result['downloads'].append({'type': 'cause_list', 'file': causelist_file})
+    
+    # Check listing (no I/O) while the downloads are in flight
+    if req.checkDate:
+        listing_info = scraper.check_listing(case_info, req.checkDate)
+        result['listing_info'] = listing_info
+    
+    for download_type, fut in downloads.items():
+        downloaded_file = fut.result()
+        if downloaded_file:
+            result['downloads'].append({'type': download_type, 'file': downloaded_file})
+    
+    return result
+
+def _submit_job(fn, *args):
+    """Queue a job on the worker pool and return its id"""
+    now = time.monotonic()
+    job_id = uuid.uuid4().hex
+    with _JOBS_LOCK:
+        # Drop jobs that finished more than JOB_TTL ago - queued and running
+        # jobs are kept however long they take
+        for stale_id, finished in list(_JOB_FINISHED.items()):
+            if now - finished > JOB_TTL:
+                del _JOBS[stale_id], _JOB_FINISHED[stale_id]
+        fut = _JOBS[job_id] = _JOB_POOL.submit(fn, *args)
+    
+    # Outside the lock - a job that has already finished runs this right here
+    fut.add_done_callback(lambda _: _job_finished(job_id))
+    return job_id
+
+def _job_finished(job_id):
+    """Start a finished job's JOB_TTL"""
+    with _JOBS_LOCK:
+        _JOB_FINISHED[job_id] = time.monotonic()
+
+@app.errorhandler(429)
+def rate_limited(e):
+    """JSON body for flask-limiter rejections"""
+    return _err(ERR_RATE_LIMITED)
+
+@app.route('/api/search', methods=['POST'])
+@limiter.limit('10/minute')
+def search():
+    """API endpoint for case search - queues the scrape and returns a job id"""
+    try:
+        if _upstream_down():
+            return _err(ERR_UPSTREAM_DOWN)
+        
+        if (request.content_length or 0) > app.config['MAX_CONTENT_LENGTH']:
+            return _err(ERR_TOO_LARGE)
+        
+        try:
+            raw = request.get_data(cache=False)
+            if len(raw) >= app.config['MAX_CONTENT_LENGTH']:
+                # Chunked bodies have no Content-Length - werkzeug cuts them off at
+                # the cap and only raises once something reads past it
+                request.stream.read(1)
+        except RequestEntityTooLarge:
+            return _err(ERR_TOO_LARGE)
+        
+        if not raw:
+            return _err(ERR_NO_DATA)
+        
+        try:
+            req = msgspec.json.decode(raw, type=SearchRequest)
+        except msgspec.DecodeError as e:
+            return jsonify({'error': f'Invalid request: {e}'}), 400
+        
+        if req.searchType == 'cnr':
+            if not req.cnr:
+                return _err(ERR_CNR_REQUIRED)
+        else:
+            missing = [field for field in ('caseType', 'caseNo', 'caseYear') if not getattr(req, field)]
+            if missing:
+                return jsonify({'error': f"Case type, number, and year are required (missing: {', '.join(missing)})"}), 400
+            
+            if not req.dist:
+                return _err(ERR_DIST_REQUIRED)
         
-        return jsonify(result)
+        job_id = _submit_job(scrape_case, req)
+        return jsonify({'job_id': job_id}), 202
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/status/<job_id>')
+def job_status(job_id):
+    """Poll the state of a queued search job"""
+    with _JOBS_LOCK:
+        fut = _JOBS.get(job_id)
+    
+    if fut is None:
+        return _err(ERR_UNKNOWN_JOB)
+    
+    if not fut.done():
+        state = 'STARTED' if fut.running() else 'PENDING'
+        return jsonify({'job_id': job_id, 'state': state})
+    
+    error = fut.exception()
+    if error is not None:
+        return jsonify({'job_id': job_id, 'state': 'FAILURE', 'error': str(error)})
+    
+    return jsonify({'job_id': job_id, 'state': 'SUCCESS', 'result': fut.result()})
+
 @app.route('/api/download/<path:filename>')
 def download_file(filename):
     """Download generated files"""
     try:
-        return send_file(filename, as_attachment=True)
+        if app.config['USE_X_ACCEL_REDIRECT']:
+            # Behind nginx: hand the file off and free the worker immediately
+            response = Response(mimetype='application/octet-stream')
+            response.headers['X-Accel-Redirect'] = f'/protected/{filename}'
+            response.headers['Content-Disposition'] = f'attachment; filename="{os.path.basename(filename)}"'
+            return response
+        
+        return send_file(filename, as_attachment=True, conditional=True, etag=True, max_age=3600)
     except Exception as e:
         return jsonify({'error': str(e)}), 404
 
 if __name__ == '__main__':
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    port = int(os.environ.get('PORT', 3000))
+    
     print("=" * 60)
     print("eCourts Scraper Web Interface")
     print("=" * 60)
-    print("\nStarting server at http://localhost:3000")
+    print(f"\nStarting server at http://localhost:{port}")
     print("Press Ctrl+C to stop\n")
     
-    app.run(debug=True, host='0.0.0.0', port=3000)
\ No newline at end of file
+    # Thread per request so status polls are never queued behind each other;
+    # the scraping itself runs on the job pool. Reloader and debugger only
+    # with FLASK_DEBUG=1.
+    app.run(debug=debug, host='0.0.0.0', port=port, threaded=True,
+            use_reloader=debug, use_debugger=debug)
@@ -7,24 +7,213 @@ Date: October 2025
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.retry import Retry
+import urllib3.util.connection as urllib3_connection
 from bs4 import BeautifulSoup
+import asyncio
+import hashlib
 import os
+import shutil
+import socket
 import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import argparse
-import time
 import json
-from urllib.parse import urljoin
+import logging
+import logging.handlers
+import queue
+from urllib.parse import urljoin, urlparse
 import re
+import secrets
+
+try:
+    import aiohttp
+except ImportError:  # fall back to sequential requests downloads
+    aiohttp = None
+
+# Under ecourts_scraper's 'ecourts' logger; named rather than __name__ so
+# running this file as a script doesn't log as __main__
+log = logging.getLogger('ecourts.causelist')
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json encoder
+    orjson = None
+
+# Hints that a link or form leads to the cause list PDF
+_KEYWORDS_RE = re.compile(r'pdf|causelist|download', re.I)
+_FORM_ACTION_RE = re.compile(r'pdf|causelist', re.I)
+
+# Delhi district courts
+DELHI_COURTS = (
+    {'name': 'Tis Hazari Courts', 'code': 'tis_hazari'},
+    {'name': 'Karkardooma Courts', 'code': 'karkardooma'},
+    {'name': 'Rohini Courts', 'code': 'rohini'},
+    {'name': 'Dwarka Courts', 'code': 'dwarka'},
+    {'name': 'Saket Courts', 'code': 'saket'},
+    {'name': 'Patiala House Courts', 'code': 'patiala_house'},
+)
+
+# Possible URL patterns for a court's cause list PDF
+URL_TEMPLATES = (
+    'https://districts.ecourts.gov.in/delhi/{code}/causelist_{date}.pdf',
+    'https://delhicourts.nic.in/{code}/causelist.pdf?date={date}',
+    'https://delhihighcourt.nic.in/dhc_case_status/causelist/{code}_{date}.pdf',
+)
+
+class _DNSCache:
+    """getaddrinfo() results per (host, port), reused for ttl seconds"""
+    
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def resolve(self, host, port):
+        """Addresses for host, honouring urllib3's IPv4/IPv6 preference"""
+        host = host.strip('[]')  # bracketed IPv6 literal
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        family = urllib3_connection.allowed_gai_family()
+        addresses = [sockaddr[0] for *_, sockaddr in
+                     socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)]
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl, addresses)
+        return addresses
+
+
+class _CachedDNSConnection:
+    """urllib3 connection mixin that connects to addresses from its dns_cache"""
+    dns_cache = None
+    
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except OSError:
+            addresses = None
+        if not addresses:
+            return super()._new_conn()  # let urllib3 resolve and report it
+        
+        # urllib3 connects to _dns_host; TLS still verifies and sends SNI
+        # for self.host, so only the lookup is skipped
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        raise error
+
+
+def _cached_dns_pool(pool_cls, dns_cache):
+    """Subclass of an urllib3 pool class whose connections resolve through dns_cache"""
+    conn_cls = pool_cls.ConnectionCls
+    cached_conn_cls = type(conn_cls.__name__, (_CachedDNSConnection, conn_cls),
+                           {'dns_cache': dns_cache})
+    return type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': cached_conn_cls})
+
+def _fast_open_option():
+    """TCP Fast Open socket option for outgoing connections, if this kernel has it"""
+    if not sys.platform.startswith('linux'):
+        return None
+    
+    option = (socket.IPPROTO_TCP, getattr(socket, 'TCP_FASTOPEN_CONNECT', 30), 1)
+    try:
+        with socket.socket() as probe:
+            probe.setsockopt(*option)
+    except OSError:
+        return None
+    return option
+
+# Send the TLS ClientHello on the SYN when reconnecting to a known court server
+_FAST_OPEN = _fast_open_option()
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + ([_FAST_OPEN] if _FAST_OPEN else [])
+
+
+def _fast_open_socket(addr_info):
+    """aiohttp socket factory applying the same options as the requests path"""
+    family, type_, proto, _, _ = addr_info
+    sock = socket.socket(family, type_, proto)
+    for option in _SOCKET_OPTIONS:
+        sock.setsockopt(*option)
+    return sock
+
+
+class _FastOpenAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled connections use _SOCKET_OPTIONS and look hosts
+    up through the adapter's own dns_cache instead of on every new connection
+    """
+    
+    def __init__(self, *args, dns_ttl=300, **kwargs):
+        self.dns_cache = _DNSCache(dns_ttl)
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _cached_dns_pool(HTTPConnectionPool, self.dns_cache),
+            'https': _cached_dns_pool(HTTPSConnectionPool, self.dns_cache),
+        }
+
+# Characters dropped from court names when building filenames
+# (ASCII punctuation; str.translate does the strip in one C-level pass)
+_UNSAFE_CHARS = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch.isspace() or ch in '_-')
+))
+
+
+class _TokenBucket:
+    """Request budget for one host: `rate` requests per second, bursts of `capacity`"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """Take a token; returns the seconds to wait before the request may start"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
 
 class DistrictCourtCauseListScraper:
     """
     Scraper for downloading cause list PDFs from district courts
     """
     
-    def __init__(self, output_dir='cause_lists'):
+    def __init__(self, output_dir='cause_lists', per_host=4, durable=False, concurrency=None,
+                 rate=2.0):
         """Initialize scraper with output directory"""
         self.output_dir = output_dir
+        self.durable = durable  # fdatasync each PDF before publishing it
+        self.concurrency = concurrency  # simultaneous downloads (None: path default)
         os.makedirs(output_dir, exist_ok=True)
         
         # Session for maintaining cookies
@@ -32,28 +221,63 @@ class DistrictCourtCauseListScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/pdf,text/html,application/xhtml+xml',
+            'Connection': 'keep-alive',
         })
         
+        # Keep connections to every court host open across candidate URLs and courts
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                        allowed_methods=['GET', 'HEAD'])
+        # Court hosts are looked up once per dns_ttl, not per connection (the
+        # aiohttp connector has its own ttl_dns_cache)
+        adapter = _FastOpenAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._dns_cache = adapter.dns_cache
+        
+        # Resolve the known court hosts in the background while we set up
+        threading.Thread(target=self._warm_dns, daemon=True).start()
+        
+        # At most per_host concurrent requests, and rate requests per second
+        # (None: unthrottled), to any one court server
+        self.per_host = per_host
+        self.rate = rate
+        self._host_slots = {}
+        self._host_buckets = {}
+        self._host_slots_lock = threading.Lock()
+        
+        # Validators (ETag / Last-Modified) of PDFs already on disk, per URL
+        self._http_cache_file = os.path.join(output_dir, '.http_cache.json')
+        self._http_cache = self._load_http_cache()
+        
+        # SHA-256 of every PDF in output_dir, so courts sharing one PDF share one file
+        self._digest_lock = threading.Lock()
+        self._hash_to_path = {}
+        self._path_digest = {}
+        self._scan_existing_pdfs()
+        
         # Statistics
         self.stats = {
             'total_attempted': 0,
             'successful_downloads': 0,
             'failed_downloads': 0,
-            'total_size_kb': 0
+            'total_size_kb': 0,
+            'corrupt_downloads': 0
         }
     
+    def _warm_dns(self):
+        """Pre-fill the resolver cache with every candidate URL host"""
+        for template in URL_TEMPLATES:
+            parts = urlparse(template)
+            try:
+                self._dns_cache.resolve(parts.hostname,
+                                        parts.port or (443 if parts.scheme == 'https' else 80))
+            except OSError:
+                pass  # resolved (or reported) again on first real use
+    
     def get_delhi_courts(self):
         """Get list of Delhi district courts"""
-        # Delhi district courts
-        courts = [
-            {'name': 'Tis Hazari Courts', 'code': 'tis_hazari'},
-            {'name': 'Karkardooma Courts', 'code': 'karkardooma'},
-            {'name': 'Rohini Courts', 'code': 'rohini'},
-            {'name': 'Dwarka Courts', 'code': 'dwarka'},
-            {'name': 'Saket Courts', 'code': 'saket'},
-            {'name': 'Patiala House Courts', 'code': 'patiala_house'},
-        ]
-        return courts
+        # Fresh dicts - callers may edit them without touching DELHI_COURTS
+        return [dict(court) for court in DELHI_COURTS]
     
     def download_cause_list_pdf(self, court_name, court_code, date_str):
         """
@@ -67,110 +291,584 @@ class DistrictCourtCauseListScraper:
         Returns:
             Path to downloaded PDF or None if failed
         """
-        self.stats['total_attempted'] += 1
+        result = self._download_court_sync({'name': court_name, 'code': court_code}, date_str)
+        self._add_stats([result])
+        return result['file']
+    
+    def _download_court_sync(self, court, date_str):
+        """
+        Race a court's candidate URLs over requests and save the first PDF that comes back
         
-        print(f"\n{'='*70}")
-        print(f"📥 Downloading: {court_name}")
-        print(f"📅 Date: {date_str}")
-        print(f"{'='*70}")
+        Touches no shared counters, so any number of these can run at once;
+        see _add_stats.
         
-        # Possible URL patterns for cause list PDFs
-        base_urls = [
-            f"https://districts.ecourts.gov.in/delhi/{court_code}/causelist_{date_str}.pdf",
-            f"https://delhicourts.nic.in/{court_code}/causelist.pdf?date={date_str}",
-            f"https://delhihighcourt.nic.in/dhc_case_status/causelist/{court_code}_{date_str}.pdf",
-        ]
+        Returns:
+            Result dict for the report (see _result)
+        """
+        court_name = court['name']
+        log.info("📥 Downloading: %s (%s)", court_name, date_str)
         
-        for url in base_urls:
-            try:
-                print(f"  🔗 Trying: {url}")
-                response = self.session.get(url, timeout=30, allow_redirects=True)
+        base_urls = self._candidate_urls(court['code'], date_str)
+        filename = self._pdf_path(court_name, date_str)
+        corrupt = 0
+        
+        # Race the candidate URLs - the first one to return a PDF wins
+        pool = ThreadPoolExecutor(max_workers=len(base_urls))
+        futures = [pool.submit(self._probe_url, url, filename) for url in base_urls]
+        pool.shutdown(wait=False)
+        
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                if not result:
+                    continue
+                
+                if 'corrupt' in result:
+                    corrupt += 1
+                    continue
+                
+                if 'cached_file' in result:
+                    self._reuse_cached_pdf(result['url'], filename)
+                    return self._result(court_name, filename, corrupt=corrupt)
+                
+                self._remember_validators(result['url'], result['headers'], filename)
+                
+                existing = self._link_duplicate(result['sha256'], filename)
+                if existing is not None:
+                    os.remove(result['part'])
+                    if existing != filename:
+                        log.info("✅ %s: Same PDF as %s -> linked %s", court_name, existing, filename)
+                    return self._result(court_name, filename, corrupt=corrupt)
+                
+                os.replace(result['part'], filename)
+                self._record_digest(result['sha256'], filename)
                 
-                if response.status_code == 200:
-                    # Check if response is actually a PDF
+                log.info("✅ %s: Downloaded %.1f KB -> %s", court_name, result['size'] / 1024, filename)
+                return self._result(court_name, filename, result['size'], corrupt)
+        finally:
+            # Don't wait for slower candidates; throw away whatever they fetch
+            for future in futures:
+                if not future.cancel():
+                    future.add_done_callback(self._discard_probe)
+        
+        # All attempts failed
+        log.warning("❌ %s: Could not download from any source", court_name)
+        return self._result(court_name, None, corrupt=corrupt)
+    
+    def _result(self, court_name, filename, size=0, corrupt=0):
+        """
+        Report entry for one court and date
+        
+        Args:
+            size: Bytes actually written (0 for 304 reuse and hard links)
+            corrupt: Truncated candidates rejected on the way
+        """
+        return {
+            'court': court_name,
+            'file': filename,
+            'status': 'success' if filename else 'failed',
+            'sha256': self._path_digest.get(filename),
+            'size_kb': size / 1024,
+            'corrupt': corrupt,
+        }
+    
+    def _add_stats(self, results):
+        """Fold finished results into self.stats, from one thread once the workers are done"""
+        for result in results:
+            self.stats['total_attempted'] += 1
+            if result['status'] == 'success':
+                self.stats['successful_downloads'] += 1
+            else:
+                self.stats['failed_downloads'] += 1
+            self.stats['total_size_kb'] += result['size_kb']
+            self.stats['corrupt_downloads'] += result['corrupt']
+    
+    def _probe_url(self, url, filename):
+        """
+        Fetch one candidate URL over requests, following an HTML page to its PDF link
+        
+        A PDF is streamed into its own .part file next to filename, so
+        candidates racing for the same court never write the same file.
+        
+        Returns:
+            {'url', 'part', 'size', 'sha256', 'headers'} for a fresh PDF,
+            {'url', 'cached_file'} when the server says our copy is current,
+            {'url', 'corrupt'} for a truncated PDF, or None
+        """
+        try:
+            with self._host_slot(url):
+                time.sleep(self._throttle(url))
+                log.info("🔗 Trying: %s", url)
+                with self.session.get(url, timeout=(5, 30), stream=True, allow_redirects=True,
+                                      headers=self._conditional_headers(url)) as response:
+                    
+                    if response.status_code == 304:
+                        return {'url': url, 'cached_file': self._http_cache[url]['path']}
+                    if response.status_code == 404:
+                        log.info("⚠️  Not found (404): %s", url)
+                        return None
+                    if response.status_code != 200:
+                        log.info("⚠️  HTTP %s: %s", response.status_code, url)
+                        return None
+                    
+                    # Check if response is actually a PDF from the first chunk only
                     content_type = response.headers.get('Content-Type', '').lower()
+                    first = next(response.iter_content(4096), b'')
                     
-                    if 'pdf' in content_type or response.content[:4] == b'%PDF':
-                        # Save PDF
-                        filename = self._save_pdf(response.content, court_name, court_code, date_str)
-                        
-                        self.stats['successful_downloads'] += 1
-                        self.stats['total_size_kb'] += len(response.content) / 1024
-                        
-                        print(f"  ✅ SUCCESS: Downloaded {len(response.content)/1024:.1f} KB")
-                        print(f"  📄 Saved as: {filename}")
-                        return filename
+                    if 'pdf' in content_type or first.startswith(b'%PDF'):
+                        return self._write_pdf_stream(url, response, first, filename)
                     
-                    # If HTML response, try to find PDF link
-                    elif 'html' in content_type:
-                        print(f"  📄 Got HTML page, searching for PDF link...")
-                        pdf_link = self._extract_pdf_link_from_html(response.text, url)
-                        
-                        if pdf_link:
-                            print(f"  🔗 Found PDF link: {pdf_link}")
-                            pdf_response = self.session.get(pdf_link, timeout=30)
-                            
-                            if pdf_response.status_code == 200 and pdf_response.content[:4] == b'%PDF':
-                                filename = self._save_pdf(pdf_response.content, court_name, court_code, date_str)
-                                
-                                self.stats['successful_downloads'] += 1
-                                self.stats['total_size_kb'] += len(pdf_response.content) / 1024
-                                
-                                print(f"  ✅ SUCCESS: Downloaded {len(pdf_response.content)/1024:.1f} KB")
-                                print(f"  📄 Saved as: {filename}")
-                                return filename
+                    # Anything but HTML: drop the connection without reading the body
+                    if 'html' not in content_type:
+                        return None
+                    
+                    html = (first + b''.join(response.iter_content(64 * 1024))).decode(
+                        response.encoding or 'utf-8', errors='replace')
+            
+            # If HTML response, try to find PDF link
+            pdf_link = self._extract_pdf_link_from_html(html, url)
+            if not pdf_link:
+                return None
+            
+            log.info("🔗 Found PDF link: %s", pdf_link)
+            with self._host_slot(pdf_link):
+                time.sleep(self._throttle(pdf_link))
+                with self.session.get(pdf_link, timeout=(5, 30), stream=True,
+                                      headers=self._conditional_headers(pdf_link)) as pdf_response:
+                    
+                    if pdf_response.status_code == 304:
+                        return {'url': pdf_link, 'cached_file': self._http_cache[pdf_link]['path']}
+                    
+                    pdf_first = next(pdf_response.iter_content(4096), b'')
+                    if pdf_response.status_code == 200 and pdf_first.startswith(b'%PDF'):
+                        return self._write_pdf_stream(pdf_link, pdf_response, pdf_first, filename)
+                    
+        except requests.exceptions.Timeout:
+            log.info("⏱️  Timeout: %s", url)
+        except requests.exceptions.ConnectionError:
+            log.info("🌐 Connection error: %s", url)
+        except Exception as e:
+            log.warning("❌ Error: %s: %s", type(e).__name__, url)
+        
+        return None
+    
+    def _host_slot(self, url):
+        """Semaphore limiting concurrent requests to url's host"""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.Semaphore(self.per_host)
+        return slot
+    
+    def _throttle(self, url):
+        """Seconds to wait before requesting url, per its host's token bucket"""
+        if not self.rate:
+            return 0.0
+        
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = self._host_buckets[host] = _TokenBucket(self.rate, self.per_host)
+        return bucket.reserve()
+    
+    @staticmethod
+    def _discard_probe(future):
+        """Remove the .part file of a candidate that lost the race"""
+        result = None if future.cancelled() else future.result()
+        if result and 'part' in result:
+            try:
+                os.remove(result['part'])
+            except FileNotFoundError:
+                pass
+    
+    def _candidate_urls(self, court_code, date_str):
+        """Possible URL patterns for a court's cause list PDF"""
+        fields = {'code': court_code, 'date': date_str}
+        return [template.format_map(fields) for template in URL_TEMPLATES]
+    
+    async def _fetch_pdf(self, session, host_slots, url):
+        """
+        Fetch one candidate URL, following an HTML page to its PDF link
+        
+        Returns:
+            {'url', 'content', 'headers'} for a fresh PDF,
+            {'url', 'cached_file'} when the server says our copy is current,
+            or None
+        """
+        try:
+            async with host_slots[urlparse(url).netloc]:
+                await asyncio.sleep(self._throttle(url))
+                log.info("🔗 Trying: %s", url)
+                async with session.get(url, allow_redirects=True,
+                                       headers=self._conditional_headers(url)) as response:
+                    if response.status == 304:
+                        return {'url': url, 'cached_file': self._http_cache[url]['path']}
+                    if response.status == 404:
+                        log.info("⚠️  Not found (404): %s", url)
+                        return None
+                    if response.status != 200:
+                        log.info("⚠️  HTTP %s: %s", response.status, url)
+                        return None
+                    
+                    content_type = response.content_type  # parsed once, already lower-case
+                    charset = response.charset or 'utf-8'
+                    content = await self._read_body(response, accept_html=True)
+            
+            if content is None:
+                return None
+            
+            if 'pdf' in content_type or content.startswith(b'%PDF'):
+                return {'url': url, 'content': content, 'headers': response.headers}
+            
+            # If HTML response, try to find PDF link
+            if 'html' in content_type:
+                html = content.decode(charset, errors='replace')
+                pdf_link = self._extract_pdf_link_from_html(html, url)
                 
-                elif response.status_code == 404:
-                    print(f"  ⚠️  Not found (404)")
-                else:
-                    print(f"  ⚠️  HTTP {response.status_code}")
+                if pdf_link:
+                    log.info("🔗 Found PDF link: %s", pdf_link)
+                    async with host_slots[urlparse(pdf_link).netloc]:
+                        await asyncio.sleep(self._throttle(pdf_link))
+                        async with session.get(pdf_link,
+                                               headers=self._conditional_headers(pdf_link)) as pdf_response:
+                            if pdf_response.status == 304:
+                                return {'url': pdf_link, 'cached_file': self._http_cache[pdf_link]['path']}
+                            
+                            pdf_content = None
+                            if pdf_response.status == 200:
+                                pdf_content = await self._read_body(pdf_response, accept_html=False)
                     
-            except requests.exceptions.Timeout:
-                print(f"  ⏱️  Timeout")
-            except requests.exceptions.ConnectionError:
-                print(f"  🌐 Connection error")
-            except Exception as e:
-                print(f"  ❌ Error: {type(e).__name__}")
+                    if pdf_content is not None and pdf_content.startswith(b'%PDF'):
+                        return {'url': pdf_link, 'content': pdf_content, 'headers': pdf_response.headers}
+                        
+        except asyncio.TimeoutError:
+            log.info("⏱️  Timeout: %s", url)
+        except aiohttp.ClientConnectionError:
+            log.info("🌐 Connection error: %s", url)
+        except Exception as e:
+            log.warning("❌ Error: %s: %s", type(e).__name__, url)
         
-        # All attempts failed
-        self.stats['failed_downloads'] += 1
-        print(f"  ❌ FAILED: Could not download from any source")
         return None
     
+    @staticmethod
+    async def _read_body(response, accept_html):
+        """
+        Read an aiohttp response body only if it can be a PDF (or HTML, when accepted)
+        
+        Returns:
+            Body bytes, or None after looking at just the first 4 bytes
+        """
+        content_type = response.content_type
+        if 'pdf' in content_type:
+            return await response.read()
+        
+        try:
+            head = await response.content.readexactly(4)
+        except asyncio.IncompleteReadError as e:
+            head = e.partial
+        
+        if head.startswith(b'%PDF') or (accept_html and 'html' in content_type):
+            return head + await response.content.read()
+        return None
+    
+    async def _download_court(self, session, host_slots, court, date_str):
+        """Race a court's candidate URLs and save the first PDF that comes back"""
+        court_name = court['name']
+        filename = self._pdf_path(court_name, date_str)
+        corrupt = 0
+        
+        tasks = [
+            asyncio.ensure_future(self._fetch_pdf(session, host_slots, url))
+            for url in self._candidate_urls(court['code'], date_str)
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                fetched = await next_done
+                if not fetched:
+                    continue
+                
+                if 'cached_file' in fetched:
+                    self._reuse_cached_pdf(fetched['url'], filename)
+                    return self._result(court_name, filename, corrupt=corrupt)
+                
+                content = fetched['content']
+                
+                if content and not _has_pdf_trailer(content):
+                    # Truncated body - keep it for inspection, wait for the next candidate
+                    with open(filename + '.corrupt', 'wb') as f:
+                        f.write(content)
+                    corrupt += 1
+                    log.warning("⚠️  Truncated PDF (no %%%%EOF): %s -> %s.corrupt", fetched['url'], filename)
+                    continue
+                
+                if content:
+                    digest = hashlib.sha256(content).hexdigest()
+                    self._remember_validators(fetched['url'], fetched['headers'], filename)
+                    
+                    existing = self._link_duplicate(digest, filename)
+                    if existing is not None:
+                        if existing != filename:
+                            log.info("✅ %s: Same PDF as %s -> linked %s", court_name, existing, filename)
+                        return self._result(court_name, filename, corrupt=corrupt)
+                    
+                    self._save_pdf(content, court_name, court['code'], date_str)
+                    self._record_digest(digest, filename)
+                    
+                    log.info("✅ %s: Downloaded %.1f KB -> %s", court_name, len(content) / 1024, filename)
+                    return self._result(court_name, filename, len(content), corrupt)
+        finally:
+            # First PDF wins - stop probing the other candidates
+            for task in tasks:
+                task.cancel()
+        
+        log.warning("❌ %s: Could not download from any source", court_name)
+        return self._result(court_name, None, corrupt=corrupt)
+    
+    async def _download_jobs_async(self, jobs, per_host=None):
+        """Run (court, date_str) downloads concurrently, results in job order"""
+        per_host = per_host or self.per_host
+        timeout = aiohttp.ClientTimeout(total=30, sock_connect=5)
+        connector = aiohttp.TCPConnector(limit=self.concurrency or 20, limit_per_host=per_host,
+                                         ttl_dns_cache=3600, socket_factory=_fast_open_socket)
+        host_slots = defaultdict(lambda: asyncio.Semaphore(per_host))
+        
+        # Let aiohttp advertise the encodings it can decode (br/zstd when installed)
+        # instead of copying requests' Accept-Encoding
+        headers = {name: value for name, value in self.session.headers.items()
+                   if name.lower() != 'accept-encoding'}
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector,
+                                         timeout=timeout) as session:
+            results = await asyncio.gather(*(
+                self._download_court(session, host_slots, court, date_str)
+                for court, date_str in jobs
+            ))
+        
+        self._add_stats(results)
+        return results
+    
     def _extract_pdf_link_from_html(self, html_content, base_url):
         """Extract PDF download link from HTML page"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Look for links containing 'pdf', 'causelist', 'download'
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            text = link.get_text().lower()
-            
-            if any(keyword in href or keyword in text for keyword in ['pdf', 'causelist', 'download']):
-                return urljoin(base_url, link['href'])
+        for link in soup.select('a[href]'):
+            href = link['href']
+            if _KEYWORDS_RE.search(href) or _KEYWORDS_RE.search(link.get_text()):
+                return urljoin(base_url, href)
         
         # Look for buttons/forms
-        for form in soup.find_all('form'):
-            action = form.get('action', '')
-            if 'pdf' in action.lower() or 'causelist' in action.lower():
+        for form in soup.select('form[action]'):
+            action = form['action']
+            if _FORM_ACTION_RE.search(action):
                 return urljoin(base_url, action)
         
         return None
     
-    def _save_pdf(self, pdf_content, court_name, court_code, date_str):
-        """Save PDF content to file with proper naming"""
+    def _load_http_cache(self):
+        """Load saved ETag / Last-Modified values from the output directory"""
+        try:
+            with open(self._http_cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_http_cache(self):
+        """Persist ETag / Last-Modified values for the next run"""
+        _write_json(self._http_cache_file, self._http_cache)
+    
+    def _conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a PDF we already have"""
+        entry = self._http_cache.get(url)
+        if not entry or not os.path.exists(entry['path']):
+            return {}
+        
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _remember_validators(self, url, headers, filename):
+        """Record the validators a PDF was served with"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if etag or last_modified:
+            self._http_cache[url] = {'etag': etag, 'last_modified': last_modified, 'path': filename}
+    
+    def _reuse_cached_pdf(self, url, filename):
+        """
+        Count a 304 Not Modified as a download of the file already on disk
+        
+        The URL may have been saved for another date or court (a landing page
+        linking to one fixed PDF), in which case filename is linked to it.
+        """
+        cached = self._http_cache[url]['path']
+        if cached != filename:
+            self._link_file(cached, filename)
+            digest = self._path_digest.get(cached)
+            if digest:
+                self._record_digest(digest, filename)
+        
+        log.info("✅ Not modified: reusing %s", cached)
+        return filename
+    
+    def _pdf_path(self, court_name, date_str):
+        """Output path for a court's cause list PDF"""
         # Clean filename
-        safe_court = re.sub(r'[^\w\s-]', '', court_name).strip().replace(' ', '_')
+        safe_court = court_name.translate(_UNSAFE_CHARS).strip().replace(' ', '_')
         safe_date = date_str.replace('-', '_').replace('/', '_')
         
-        filename = f"{self.output_dir}/{safe_court}_{safe_date}.pdf"
+        return os.path.join(self.output_dir, f"{safe_court}_{safe_date}.pdf")
+    
+    def _write_pdf_stream(self, url, response, first, filename):
+        """
+        Stream a PDF response chunk by chunk into a fresh .part file beside filename
+        
+        Returns:
+            {'url', 'part', 'size', 'sha256', 'headers'}, or {'url', 'corrupt'}
+            if the body was truncated (saved as filename.corrupt)
+        """
+        f, part = self._open_part(filename)
+        size = len(first)
+        digest = hashlib.sha256(first)
+        tail = first[-1024:]
+        
+        try:
+            with f:
+                f.write(first)
+                for chunk in response.iter_content(1 << 20):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tail = chunk[-1024:] if len(chunk) >= 1024 else (tail + chunk)[-1024:]
+                self._flush_part(f)
+        except BaseException:
+            os.remove(part)
+            raise
+        
+        if not _has_pdf_trailer(tail):
+            # Truncated body - keep it for inspection, let another candidate win
+            os.replace(part, filename + '.corrupt')
+            log.warning("⚠️  Truncated PDF (no %%%%EOF): %s -> %s.corrupt", url, filename)
+            return {'url': url, 'corrupt': True}
+        
+        return {'url': url, 'part': part, 'size': size, 'sha256': digest.hexdigest(),
+                'headers': response.headers}
+    
+    def _save_pdf(self, pdf_content, court_name, court_code, date_str):
+        """Save PDF content to file with proper naming"""
+        filename = self._pdf_path(court_name, date_str)
+        f, part = self._open_part(filename)
         
-        # Save file
-        with open(filename, 'wb') as f:
-            f.write(pdf_content)
+        try:
+            with f:
+                f.write(pdf_content)
+                self._flush_part(f)
+        except BaseException:
+            os.remove(part)
+            raise
         
+        # Atomic publish: no half-written PDFs in output_dir, and a hard link
+        # shared with another court's copy is swapped out, never overwritten
+        os.replace(part, filename)
         return filename
     
+    def _open_part(self, filename):
+        """
+        Open a unique .part file beside filename for writing
+        
+        Returns:
+            (file object, path of the .part file)
+        """
+        prefix = os.path.join(self.output_dir, os.path.basename(filename))
+        while True:
+            part = f"{prefix}.{secrets.token_hex(4)}.part"
+            try:
+                # 0o666 less the umask, like open() - os.replace keeps the mode, so
+                # mkstemp's 0600 would be published as-is
+                fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            except FileExistsError:
+                continue
+            return os.fdopen(fd, 'wb', buffering=1 << 20), part
+    
+    def _flush_part(self, f):
+        """Flush a .part file, syncing it to disk when durable output was asked for"""
+        f.flush()
+        if self.durable:
+            getattr(os, 'fdatasync', os.fsync)(f.fileno())
+    
+    def _scan_existing_pdfs(self):
+        """Hash the PDFs already in output_dir"""
+        for name in os.listdir(self.output_dir):
+            if not name.endswith('.pdf'):
+                continue
+            
+            path = os.path.join(self.output_dir, name)
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            self._record_digest(digest.hexdigest(), path)
+    
+    def _record_digest(self, digest, filename):
+        """Remember that filename now holds the PDF with this SHA-256"""
+        with self._digest_lock:
+            previous = self._path_digest.get(filename)
+            if previous and self._hash_to_path.get(previous) == filename:
+                del self._hash_to_path[previous]
+            
+            self._path_digest[filename] = digest
+            self._hash_to_path.setdefault(digest, filename)
+    
+    def _link_duplicate(self, digest, filename):
+        """
+        Hard-link filename to an identical PDF that is already saved
+        
+        Returns:
+            Path of the PDF filename now matches (filename itself if it already
+            held it), None if filename still needs writing
+        """
+        with self._digest_lock:
+            existing = self._hash_to_path.get(digest)
+        
+        if existing is None or not os.path.exists(existing):
+            return None
+        
+        if existing != filename:
+            self._link_file(existing, filename)
+        
+        self._record_digest(digest, filename)
+        return existing
+    
+    @staticmethod
+    def _link_file(existing, filename):
+        """Atomically make filename a hard link to existing"""
+        if os.path.exists(filename) and os.path.samefile(existing, filename):
+            return  # already linked (renaming over the same inode would leave tmp behind)
+        
+        # Unique name so concurrent links to the same filename can't collide;
+        # os.link won't overwrite, so only the name is kept
+        fd, tmp = tempfile.mkstemp(prefix=os.path.basename(filename) + '.', suffix='.link',
+                                   dir=os.path.dirname(filename) or '.')
+        os.close(fd)
+        os.unlink(tmp)
+        try:
+            try:
+                os.link(existing, tmp)
+            except OSError:
+                # Filesystem without hard links - fall back to a plain copy
+                shutil.copyfile(existing, tmp)
+            os.replace(tmp, filename)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+    
     def batch_download(self, date_str, courts=None):
         """
         Download cause lists from multiple courts
@@ -190,33 +888,8 @@ class DistrictCourtCauseListScraper:
         print(f"📁 Output: {self.output_dir}/")
         print("="*70)
         
-        downloaded_files = []
-        
-        for i, court in enumerate(courts, 1):
-            print(f"\n[{i}/{len(courts)}] Processing...")
-            
-            filename = self.download_cause_list_pdf(
-                court['name'],
-                court['code'],
-                date_str
-            )
-            
-            if filename:
-                downloaded_files.append({
-                    'court': court['name'],
-                    'file': filename,
-                    'status': 'success'
-                })
-            else:
-                downloaded_files.append({
-                    'court': court['name'],
-                    'file': None,
-                    'status': 'failed'
-                })
-            
-            # Rate limiting - be respectful to servers
-            if i < len(courts):
-                time.sleep(2)
+        downloaded_files = self._download_jobs([(court, date_str) for court in courts])
+        self._save_http_cache()
         
         # Generate summary
         self._print_summary(date_str, downloaded_files)
@@ -224,6 +897,64 @@ class DistrictCourtCauseListScraper:
         
         return downloaded_files
     
+    def batch_download_range(self, start_date, end_date, courts=None):
+        """
+        Download cause lists from multiple courts for every date in a range
+        
+        All (date, court) pairs run in one pass over the same connection pool.
+        Days that re-serve an earlier PDF (weekends, holidays) are hard-linked
+        by the content-hash check rather than stored again.
+        
+        Args:
+            start_date: First date in DD-MM-YYYY format
+            end_date: Last date (inclusive) in DD-MM-YYYY format
+            courts: List of court dicts (if None, uses Delhi courts)
+        """
+        if courts is None:
+            courts = self.get_delhi_courts()
+        dates = _date_range(start_date, end_date)
+        
+        print("\n" + "="*70)
+        print("🏛️  DISTRICT COURT CAUSE LIST SCRAPER")
+        print("="*70)
+        print(f"📅 Dates: {start_date} to {end_date} ({len(dates)} days)")
+        print(f"🏢 Courts: {len(courts)}")
+        print(f"📁 Output: {self.output_dir}/")
+        print("="*70)
+        
+        jobs = [(court, date_str) for date_str in dates for court in courts]
+        downloaded_files = self._download_jobs(jobs)
+        for result, (_, date_str) in zip(downloaded_files, jobs):
+            result['date'] = date_str
+        
+        self._save_http_cache()
+        
+        # Generate summary
+        self._print_summary(f"{start_date} to {end_date}", downloaded_files)
+        self._save_report(f"{start_date}_to_{end_date}", downloaded_files)
+        
+        return downloaded_files
+    
+    def _download_jobs(self, jobs):
+        """Download (court, date_str) jobs on the fastest available path"""
+        if aiohttp is not None:
+            return asyncio.run(self._download_jobs_async(jobs))
+        return self._download_jobs_threaded(jobs)
+    
+    def _download_jobs_threaded(self, jobs, max_workers=None):
+        """Run (court, date_str) downloads on a thread pool, results in job order"""
+        
+        def download(job):
+            court, date_str = job
+            return self._download_court_sync(court, date_str)
+        
+        # Per-host semaphores keep this polite to shared court servers
+        with ThreadPoolExecutor(max_workers=max_workers or self.concurrency or 6) as pool:
+            results = list(pool.map(download, jobs))
+        
+        self._add_stats(results)
+        return results
+    
     def _print_summary(self, date_str, results):
         """Print download summary"""
         print("\n" + "="*70)
@@ -235,6 +966,8 @@ class DistrictCourtCauseListScraper:
         print(f"  Total Attempted:  {self.stats['total_attempted']}")
         print(f"  ✅ Successful:     {self.stats['successful_downloads']}")
         print(f"  ❌ Failed:         {self.stats['failed_downloads']}")
+        if self.stats['corrupt_downloads']:
+            print(f"  ⚠️  Truncated:      {self.stats['corrupt_downloads']}")
         print(f"  📦 Total Size:     {self.stats['total_size_kb']:.1f} KB")
         
         if self.stats['successful_downloads'] > 0:
@@ -259,14 +992,80 @@ class DistrictCourtCauseListScraper:
             'results': results
         }
         
-        report_file = f"{self.output_dir}/report_{date_str.replace('-', '_')}.json"
+        report_file = os.path.join(self.output_dir, f"report_{date_str.replace('-', '_')}.json")
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        _write_json(report_file, report)
         
         print(f"\n📋 Report saved: {report_file}")
 
 
+def _has_pdf_trailer(data):
+    """Cheap truncation check: a complete PDF has %%EOF in its last 1 KB"""
+    return data.find(b'%%EOF', max(0, len(data) - 1024)) != -1
+
+
+def _date_range(start_date, end_date):
+    """DD-MM-YYYY dates from start_date to end_date, inclusive"""
+    start = datetime.strptime(start_date, '%d-%m-%Y')
+    end = datetime.strptime(end_date, '%d-%m-%Y')
+    return [_fmt_date(start + timedelta(days=n)) for n in range((end - start).days + 1)]
+
+
+def _fmt_date(d):
+    """DD-MM-YYYY without going through locale-aware strftime"""
+    return f"{d.day:02d}-{d.month:02d}-{d.year:04d}"
+
+
+@contextmanager
+def _atomic_open(path, mode='wb', **kwargs):
+    """
+    Open a private .part file next to path and move it over path once the
+    block completes, so a crash mid-write never leaves a truncated report or cache
+    """
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.part"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json(path, data):
+    """Write data as indented UTF-8 JSON, through orjson when it is installed"""
+    if orjson is not None:
+        with _atomic_open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with _atomic_open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _setup_logging():
+    """
+    Log progress to stderr through a queue, so download threads hand records
+    off instead of blocking on terminal writes
+    
+    Returns:
+        The started QueueListener (stop it to flush)
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 def main():
     """Main function with CLI interface"""
     parser = argparse.ArgumentParser(
@@ -283,6 +1082,9 @@ Examples:
   # Download for specific date
   python causelist_scraper.py --date 20-10-2025
   
+  # Backfill a range of dates in one pass
+  python causelist_scraper.py --from 01-10-2025 --to 20-10-2025
+  
   # Specify output directory
   python causelist_scraper.py --today --output downloads
         """
@@ -295,16 +1097,30 @@ Examples:
                           help='Download tomorrow\'s cause lists')
     date_group.add_argument('--date',
                           help='Specific date (DD-MM-YYYY format)')
+    date_group.add_argument('--from', dest='from_date',
+                          help='First date of a range (DD-MM-YYYY format)')
+    
+    parser.add_argument('--to', dest='to_date',
+                       help='Last date of a --from range (DD-MM-YYYY format, default: today)')
+    parser.add_argument('--rate', type=float, default=2.0,
+                       help='Requests per second to any one court server, 0 for no limit (default: 2)')
+    parser.add_argument('--concurrency', type=int,
+                       help='Maximum simultaneous downloads (default: 20, or 6 courts without aiohttp)')
     
     parser.add_argument('--output', default='cause_lists',
                        help='Output directory (default: cause_lists)')
+    parser.add_argument('--fsync', action='store_true',
+                       help='Sync each PDF to disk before publishing it (slower, survives power loss)')
     
     args = parser.parse_args()
     
+    if args.to_date and not args.from_date:
+        parser.error('--to requires --from')
+    
     # Determine date
     if args.tomorrow:
         date_obj = datetime.now() + timedelta(days=1)
-        date_str = date_obj.strftime('%d-%m-%Y')
+        date_str = _fmt_date(date_obj)
     elif args.date:
         # Validate date format
         try:
@@ -313,15 +1129,29 @@ Examples:
         except ValueError:
             print("❌ Error: Date must be in DD-MM-YYYY format")
             sys.exit(1)
+    elif args.from_date:
+        end_date = args.to_date or _fmt_date(datetime.now())
+        try:
+            if datetime.strptime(args.from_date, '%d-%m-%Y') > datetime.strptime(end_date, '%d-%m-%Y'):
+                print("❌ Error: --from date must not be after --to date")
+                sys.exit(1)
+        except ValueError:
+            print("❌ Error: Date must be in DD-MM-YYYY format")
+            sys.exit(1)
     else:  # --today
-        date_str = datetime.now().strftime('%d-%m-%Y')
+        date_str = _fmt_date(datetime.now())
     
     # Initialize scraper
-    scraper = DistrictCourtCauseListScraper(output_dir=args.output)
+    scraper = DistrictCourtCauseListScraper(output_dir=args.output, durable=args.fsync,
+                                            concurrency=args.concurrency, rate=args.rate)
+    listener = _setup_logging()
     
     try:
         # Download cause lists
-        results = scraper.batch_download(date_str)
+        if args.from_date:
+            results = scraper.batch_download_range(args.from_date, end_date)
+        else:
+            results = scraper.batch_download(date_str)
         
         # Exit code based on success
         if scraper.stats['successful_downloads'] > 0:
@@ -337,6 +1167,8 @@ Examples:
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
@@ -4,58 +4,298 @@ eCourts Scraper - Fixed version with actual eCourts website integration
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+import asyncio
 import json
 import argparse
+import logging
 import sys
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, List
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from typing import Optional, Dict, Iterator, List
 import os
+import shutil
+import threading
 import time
 import re
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:  # fall back to sequential requests searches
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json encoder
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # fall back to BeautifulSoup for cause lists
+    HTMLParser = None
+
+log = logging.getLogger('ecourts')
+
+# Separators people type inside CNR numbers (e.g. DLCT01-123456-2024)
+_CNR_SEPARATORS = str.maketrans('', '', '- /\t')
+
+# Only table subtrees are ever read - skip building the rest of the page
+_TABLES_ONLY = SoupStrainer('table')
+
+# Error banners eCourts returns instead of case details
+_NOT_FOUND_RE = re.compile(r'not found|no record', re.IGNORECASE)
+_CAPTCHA_RE = re.compile(r'captcha', re.IGNORECASE)
+
+# How long homepage cookies are trusted before the next search visits it again
+_SESSION_TTL = 15 * 60
+
+# Search errors that say nothing about the session - anything else (CAPTCHA,
+# an unparseable or empty page, an HTTP error) makes the next search re-warm it
+_SESSION_OK_ERRORS = ('Case not found', 'Request timeout', 'Connection failed')
+
+# Anything that can't go in a debug dump's or cause list's filename
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# Case-details row headers -> result field, checked in order; first match wins
+_HEADER_PATTERNS = (
+    ('court_name', re.compile(r'court|bench')),
+    ('serial_number', re.compile(r'serial|sr\. no|sl\. no')),
+    ('party_names', re.compile(r'petitioner|part(?:y|ies)')),
+    ('case_status', re.compile(r'status')),
+    ('next_hearing_date', re.compile(r'next date|hearing date|next hearing')),
+)
+_ALL_HEADERS = (1 << len(_HEADER_PATTERNS)) - 1
+
+def normalise_cnr(cnr_number: str) -> str:
+    """Canonical CNR form - uppercase with separators stripped"""
+    return cnr_number.translate(_CNR_SEPARATORS).upper()
+
+@contextmanager
+def _atomic_open(path: str, mode: str = 'wb', **kwargs):
+    """
+    Open a private temp file next to path and move it over path once the
+    block completes, so readers see the old file or the new one - never half of one
+    """
+    tmp = f"{path}.{os.getpid()}-{threading.get_ident()}.part"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _write_json(path: str, data):
+    """Write data as indented UTF-8 JSON, through orjson when it is installed"""
+    if orjson is not None:
+        with _atomic_open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with _atomic_open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _text(cell) -> str:
+    """Stripped text of a table cell - plain-text cells skip get_text's descendant walk"""
+    text = cell.string
+    if text is not None and text.__class__ is NavigableString:  # not a Comment/CData
+        return text.strip()
+    return cell.get_text(strip=True)
+
+# One cause-list row - a tuple instead of a dict per row keeps long lists compact
+CauseEntry = namedtuple('CauseEntry', 'serial_no case_number parties purpose')
+
+def _write_jsonl(path: str, records) -> int:
+    """Write records as JSON Lines as they arrive, returning how many were written"""
+    count = 0
+    with _atomic_open(path, 'wb') as f:
+        for record in records:
+            if orjson is not None:
+                f.write(orjson.dumps(record))
+            else:
+                f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+            f.write(b'\n')
+            count += 1
+    return count
+
+# Hearing dates as eCourts prints them: DD-MM-YYYY, DD/MM/YYYY or YYYY-MM-DD
+_DATE_RE = re.compile(r'(\d{1,2})([-/])(\d{1,2})\2(\d{4})|(\d{4})-(\d{1,2})-(\d{1,2})')
+
+def _parse_date(date_str: str):
+    """Hearing date string -> date, or None if it isn't in a known format"""
+    m = _DATE_RE.fullmatch(date_str.strip())
+    if not m:
+        return None
+    day, _, month, year, iso_year, iso_month, iso_day = m.groups()
+    try:
+        if year:
+            return datetime(int(year), int(month), int(day)).date()
+        return datetime(int(iso_year), int(iso_month), int(iso_day)).date()
+    except ValueError:  # e.g. 31-02-2024
+        return None
+
+def _parse_case_html(html_content: str, case_id: str, debug_file: Optional[str] = None,
+                     timestamp: Optional[str] = None) -> Dict:
+    """
+    Case details from a search response
+    
+    Module-level (and so picklable) so search batches can run it on a
+    process pool; debug_file is where the caller saved the raw response, if it did,
+    and timestamp is a batch's shared run time (now, by default).
+    """
+    case_info = {
+        'case_id': case_id,
+        'found': False,
+        'listing_info': None,
+        'court_name': None,
+        'serial_number': None,
+        'party_names': None,
+        'case_status': None,
+        'next_hearing_date': None,
+        'timestamp': timestamp or datetime.now().isoformat()
+    }
+    
+    # Check for common error messages
+    if _NOT_FOUND_RE.search(html_content):
+        log.info("⚠️  Case not found in eCourts database")
+        case_info['error'] = "Case not found"
+        return case_info
+    
+    if _CAPTCHA_RE.search(html_content):
+        log.warning("🔐 CAPTCHA detected - manual intervention may be required")
+        case_info['error'] = "CAPTCHA required"
+        return case_info
+    
+    soup = BeautifulSoup(html_content, 'lxml', parse_only=_TABLES_ONLY)
+    
+    # Try to find case information in various table structures
+    rows = soup.select('table tr')
+    log.debug("📋 Found %d table rows in response", len(rows))
+    
+    # The last row matching a field wins, so walk the rows bottom-up and keep
+    # the first value seen for each field
+    filled = 0  # bit i set once _HEADER_PATTERNS[i] has matched a row
+    for row in reversed(rows):
+        cells = row.find_all(['td', 'th'], recursive=False)
+        if len(cells) >= 2:
+            header = _text(cells[0]).lower()
+            
+            # Map common field names
+            for bit, (key, pattern) in enumerate(_HEADER_PATTERNS):
+                if pattern.search(header):
+                    if not filled & (1 << bit):
+                        case_info[key] = _text(cells[1])
+                        if key in ('court_name', 'party_names'):
+                            case_info['found'] = True
+                        filled |= 1 << bit
+                    break
+            
+            # Every field found - the rows above can't change anything
+            if filled == _ALL_HEADERS:
+                break
+    
+    # If we found any data, mark as found
+    if case_info['court_name'] or case_info['party_names']:
+        case_info['found'] = True
+        log.info("✓ Case information extracted successfully")
+    else:
+        log.warning("⚠️  Could not extract case details from response")
+        if debug_file:
+            case_info['error'] = f"Could not parse case details (check {debug_file})"
+        else:
+            case_info['error'] = "Could not parse case details (rerun with --debug to save the response)"
+    
+    return case_info
 
 class ECourtsScraper:
-    def __init__(self):
+    def __init__(self, pool_maxsize: int = 10, debug: bool = False):
         self.base_url = "https://services.ecourts.gov.in/ecourtindia_v6/"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # gzip, deflate, plus br/zstd when brotli/backports.zstd are installed -
+            # only what urllib3 can actually decode
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
             'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
+            'Upgrade-Insecure-Requests': '1',
+            'Referer': self.base_url,
+            'Origin': self.base_url.rstrip('/')
         })
+        
+        # Pooled keep-alive connections, reused across every call on this scraper.
+        # pool_maxsize should cover the number of threads sharing the scraper,
+        # otherwise extra connections are opened and thrown away after each call.
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.captcha_token = None
         
+        # Save raw responses for inspection (--debug or ECOURTS_DEBUG=1)
+        self.debug = debug or bool(os.environ.get('ECOURTS_DEBUG'))
+        
+        # Worker processes for parsing batch search responses - started on first
+        # use and shut down when the batch finishes (see search_many)
+        self._parse_pool = None
+        
+        # Homepage cookies, picked up by the first search rather than here so
+        # building a scraper (e.g. at app import) never touches the network;
+        # later searches reuse them until _SESSION_TTL runs out or a response
+        # suggests eCourts has dropped the session (see _check_session)
+        self._session_expires = 0.0  # time.monotonic() deadline
+        self._init_lock = threading.Lock()
+    
     def _get_captcha(self):
         """Get CAPTCHA (if required) - placeholder for manual entry"""
-        print("\n⚠️  Note: eCourts may require CAPTCHA verification")
-        print("If you see a CAPTCHA on the website, this script may need manual intervention")
+        log.warning("⚠️  Note: eCourts may require CAPTCHA verification - "
+                    "if you see a CAPTCHA on the website, this script may need manual intervention")
         return None
     
     def _init_session(self):
-        """Initialize session by visiting the homepage"""
-        try:
-            response = self.session.get(self.base_url, timeout=10)
-            if response.status_code == 200:
-                print("✓ Session initialized successfully")
+        """Initialize session by visiting the homepage (a no-op while the last visit is fresh)"""
+        if time.monotonic() < self._session_expires:
+            return True
+        
+        with self._init_lock:
+            if time.monotonic() < self._session_expires:  # another thread got there first
                 return True
-            else:
-                print(f"⚠️  Session initialization warning: Status {response.status_code}")
+            try:
+                response = self.session.get(self.base_url, timeout=10)
+                if response.status_code == 200:
+                    log.info("✓ Session initialized successfully")
+                    self._session_expires = time.monotonic() + _SESSION_TTL
+                    return True
+                else:
+                    log.warning("⚠️  Session initialization warning: Status %s", response.status_code)
+                    return False
+            except Exception as e:
+                log.warning("❌ Error initializing session: %s", e)
                 return False
-        except Exception as e:
-            print(f"❌ Error initializing session: {e}")
-            return False
+    
+    def _check_session(self, case_info: Dict) -> Dict:
+        """Pass a search result through, expiring the session if it looks stale"""
+        error = case_info.get('error')
+        if error and error not in _SESSION_OK_ERRORS:
+            self._session_expires = 0.0
+        return case_info
     
     def search_by_cnr(self, state_code: str, cnr_number: str) -> Optional[Dict]:
         """Search case by CNR number"""
         try:
-            print(f"\n🔍 Searching for CNR: {cnr_number}")
+            log.info("🔍 Searching for CNR: %s", cnr_number)
             
-            # Initialize session first
+            # Visit the homepage first if no search has yet (or the last visit failed)
             if not self._init_session():
-                print("⚠️  Continuing despite session initialization issue...")
+                log.warning("⚠️  Continuing despite session initialization issue...")
             
             # CNR search URL structure
             search_url = f"{self.base_url}CNRSearch"
@@ -66,48 +306,114 @@ class ECourtsScraper:
                 'cino': cnr_number,
             }
             
-            # Add state code to headers or payload as needed
-            self.session.headers.update({
-                'Referer': self.base_url,
-                'Origin': self.base_url.rstrip('/')
-            })
-            
-            print("📡 Sending request to eCourts...")
+            log.info("📡 Sending request to eCourts...")
             response = self.session.post(search_url, data=payload, timeout=15, allow_redirects=True)
             
-            print(f"📊 Response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                # Check if we got valid HTML
-                if len(response.text) < 100:
-                    print("⚠️  Received empty or very short response")
-                    return self._create_error_response(cnr_number, "Empty response from server")
-                
-                return self._parse_case_details(response.text, cnr_number)
-            else:
-                print(f"❌ HTTP Error: {response.status_code}")
-                return self._create_error_response(cnr_number, f"HTTP {response.status_code}")
+            return self._check_session(self._cnr_error(cnr_number, response.status_code, response.text)
+                                       or self._parse_case_details(response.text, cnr_number))
                 
         except requests.exceptions.Timeout:
-            print("⏱️  Request timeout - eCourts server may be slow or down")
+            log.warning("⏱️  Request timeout - eCourts server may be slow or down")
             return self._create_error_response(cnr_number, "Request timeout")
         except requests.exceptions.ConnectionError:
-            print("🌐 Connection error - Check internet connection")
+            log.warning("🌐 Connection error - Check internet connection")
             return self._create_error_response(cnr_number, "Connection failed")
         except Exception as e:
-            print(f"❌ Unexpected error: {type(e).__name__}: {e}")
+            log.warning("❌ Unexpected error: %s: %s", type(e).__name__, e)
             return self._create_error_response(cnr_number, str(e))
     
+    async def search_by_cnr_async(self, session, state_code: str, cnr_number: str,
+                                  timestamp: Optional[str] = None) -> Optional[Dict]:
+        """search_by_cnr over a shared aiohttp session (see search_many)"""
+        try:
+            log.info("🔍 Searching for CNR: %s", cnr_number)
+            
+            search_url = f"{self.base_url}CNRSearch"
+            
+            payload = {
+                'CNR_number': cnr_number,
+                'cino': cnr_number,
+            }
+            
+            log.info("📡 Sending request to eCourts...")
+            async with session.post(search_url, data=payload) as response:
+                status = response.status
+                text = await response.text()
+            
+            return self._check_session(self._cnr_error(cnr_number, status, text, timestamp)
+                                       or await self._parse_case_details_async(text, cnr_number, timestamp))
+                
+        except asyncio.TimeoutError:
+            log.warning("⏱️  Request timeout - eCourts server may be slow or down")
+            return self._create_error_response(cnr_number, "Request timeout", timestamp)
+        except aiohttp.ClientConnectionError:
+            log.warning("🌐 Connection error - Check internet connection")
+            return self._create_error_response(cnr_number, "Connection failed", timestamp)
+        except Exception as e:
+            log.warning("❌ Unexpected error: %s: %s", type(e).__name__, e)
+            return self._create_error_response(cnr_number, str(e), timestamp)
+    
+    async def search_many(self, state_code: str, cnr_numbers: List[str]) -> List[Dict]:
+        """Search several CNRs concurrently, results in input order"""
+        # Visit the homepage first if no search has yet - the cookies are copied below
+        if not await asyncio.to_thread(self._init_session):
+            log.warning("⚠️  Continuing despite session initialization issue...")
+        
+        timeout = aiohttp.ClientTimeout(total=15)
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        
+        # Same headers and homepage cookies as the requests session; aiohttp
+        # advertises the encodings it can decode itself
+        headers = {name: value for name, value in self.session.headers.items()
+                   if name.lower() != 'accept-encoding'}
+        
+        # One timestamp for the whole batch rather than a clock read per case
+        timestamp = datetime.now().isoformat()
+        
+        try:
+            async with aiohttp.ClientSession(headers=headers, cookies=self.session.cookies.get_dict(),
+                                             connector=connector, timeout=timeout) as session:
+                return await asyncio.gather(*(
+                    self.search_by_cnr_async(session, state_code, cnr_number, timestamp)
+                    for cnr_number in cnr_numbers
+                ))
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+    
+    def search_cnrs(self, state_code: str, cnr_numbers: List[str]) -> List[Dict]:
+        """Search several CNRs - concurrently with aiohttp, one by one without it"""
+        if aiohttp is not None:
+            return asyncio.run(self.search_many(state_code, cnr_numbers))
+        return [self.search_by_cnr(state_code, cnr_number) for cnr_number in cnr_numbers]
+    
+    def _cnr_error(self, cnr_number: str, status: int, text: str,
+                   timestamp: Optional[str] = None) -> Optional[Dict]:
+        """Error response for a CNR search that came back unusable, None if it can be parsed"""
+        log.info("📊 Response status: %s", status)
+        
+        if status == 200:
+            # Check if we got valid HTML
+            if len(text) < 100:
+                log.warning("⚠️  Received empty or very short response")
+                return self._create_error_response(cnr_number, "Empty response from server", timestamp)
+            
+            return None
+        else:
+            log.warning("❌ HTTP Error: %s", status)
+            return self._create_error_response(cnr_number, f"HTTP {status}", timestamp)
+    
     def search_by_case_number(self, state_code: str, dist_code: str, 
                              case_type: str, case_no: str, case_year: str) -> Optional[Dict]:
         """Search case by case type, number, and year"""
         try:
             case_id = f"{case_type}/{case_no}/{case_year}"
-            print(f"\n🔍 Searching for Case: {case_id}")
+            log.info("🔍 Searching for Case: %s", case_id)
             
-            # Initialize session
+            # Visit the homepage first if no search has yet (or the last visit failed)
             if not self._init_session():
-                print("⚠️  Continuing despite session initialization issue...")
+                log.warning("⚠️  Continuing despite session initialization issue...")
             
             search_url = f"{self.base_url}CaseNumberSearch"
             
@@ -120,22 +426,29 @@ class ECourtsScraper:
                 'case_year': case_year,
             }
             
-            print("📡 Sending request to eCourts...")
+            log.info("📡 Sending request to eCourts...")
             response = self.session.post(search_url, data=payload, timeout=15)
             
-            print(f"📊 Response status: {response.status_code}")
+            log.info("📊 Response status: %s", response.status_code)
             
             if response.status_code == 200:
-                return self._parse_case_details(response.text, case_id)
+                return self._check_session(self._parse_case_details(response.text, case_id))
             else:
-                return self._create_error_response(case_id, f"HTTP {response.status_code}")
+                return self._check_session(self._create_error_response(case_id, f"HTTP {response.status_code}"))
                 
+        except requests.exceptions.Timeout:
+            log.warning("⏱️  Request timeout - eCourts server may be slow or down")
+            return self._create_error_response(case_id, "Request timeout")
+        except requests.exceptions.ConnectionError:
+            log.warning("🌐 Connection error - Check internet connection")
+            return self._create_error_response(case_id, "Connection failed")
         except Exception as e:
-            print(f"❌ Error: {e}")
+            log.warning("❌ Error: %s", e)
             case_id = f"{case_type}/{case_no}/{case_year}"
             return self._create_error_response(case_id, str(e))
     
-    def _create_error_response(self, case_id: str, error_msg: str) -> Dict:
+    def _create_error_response(self, case_id: str, error_msg: str,
+                               timestamp: Optional[str] = None) -> Dict:
         """Create a structured error response"""
         return {
             'case_id': case_id,
@@ -144,79 +457,28 @@ class ECourtsScraper:
             'listing_info': None,
             'court_name': None,
             'serial_number': None,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp or datetime.now().isoformat(),
             'note': 'The eCourts website may require CAPTCHA or be temporarily unavailable'
         }
     
     def _parse_case_details(self, html_content: str, case_id: str) -> Dict:
         """Parse case details from HTML response"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        case_info = {
-            'case_id': case_id,
-            'found': False,
-            'listing_info': None,
-            'court_name': None,
-            'serial_number': None,
-            'party_names': None,
-            'case_status': None,
-            'next_hearing_date': None,
-            'timestamp': datetime.now().isoformat()
-        }
-        
         # Debug: Save HTML to file for inspection
-        debug_file = 'debug_response.html'
-        with open(debug_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"💾 Response saved to {debug_file} for inspection")
-        
-        # Check for common error messages
-        text_lower = html_content.lower()
-        if 'not found' in text_lower or 'no record' in text_lower:
-            print("⚠️  Case not found in eCourts database")
-            case_info['error'] = "Case not found"
-            return case_info
-        
-        if 'captcha' in text_lower:
-            print("🔐 CAPTCHA detected - manual intervention may be required")
-            case_info['error'] = "CAPTCHA required"
-            return case_info
-        
-        # Try to find case information in various table structures
-        tables = soup.find_all('table')
-        print(f"📋 Found {len(tables)} tables in response")
-        
-        for idx, table in enumerate(tables):
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    header = cells[0].get_text(strip=True).lower()
-                    value = cells[1].get_text(strip=True)
-                    
-                    # Map common field names
-                    if any(x in header for x in ['court name', 'court', 'bench']):
-                        case_info['court_name'] = value
-                        case_info['found'] = True
-                    elif any(x in header for x in ['serial', 'sr. no', 'sl. no']):
-                        case_info['serial_number'] = value
-                    elif any(x in header for x in ['petitioner', 'party', 'parties']):
-                        case_info['party_names'] = value
-                        case_info['found'] = True
-                    elif any(x in header for x in ['status', 'case status']):
-                        case_info['case_status'] = value
-                    elif any(x in header for x in ['next date', 'hearing date', 'next hearing']):
-                        case_info['next_hearing_date'] = value
+        debug_file = self._save_debug(f"response_{case_id}", html_content)
+        return _parse_case_html(html_content, case_id, debug_file)
+    
+    async def _parse_case_details_async(self, html_content: str, case_id: str,
+                                        timestamp: Optional[str] = None) -> Dict:
+        """_parse_case_details on the parse pool, so batch searches keep the event loop free"""
+        # The debug dump is a disk write - keep it off the event loop too
+        debug_file = await asyncio.to_thread(self._save_debug, f"response_{case_id}", html_content)
         
-        # If we found any data, mark as found
-        if case_info['court_name'] or case_info['party_names']:
-            case_info['found'] = True
-            print("✓ Case information extracted successfully")
-        else:
-            print("⚠️  Could not extract case details from response")
-            case_info['error'] = "Could not parse case details (check debug_response.html)"
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
         
-        return case_info
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, _parse_case_html,
+                                          html_content, case_id, debug_file, timestamp)
     
     def check_listing(self, case_info: Dict, check_date: str = 'today') -> Dict:
         """Check if case is listed for today or tomorrow"""
@@ -240,17 +502,12 @@ class ECourtsScraper:
                 # Try to parse the date (format may vary)
                 hearing_date_str = case_info['next_hearing_date']
                 # Common formats: DD-MM-YYYY, DD/MM/YYYY, etc.
-                for date_format in ['%d-%m-%Y', '%d/%m/%Y', '%Y-%m-%d']:
-                    try:
-                        hearing_date = datetime.strptime(hearing_date_str, date_format).date()
-                        if hearing_date == target_date:
-                            result['is_listed'] = True
-                            print(f"✓ Case is listed for {check_date}")
-                        break
-                    except ValueError:
-                        continue
+                hearing_date = _parse_date(hearing_date_str)
+                if hearing_date == target_date:
+                    result['is_listed'] = True
+                    log.info("✓ Case is listed for %s", check_date)
             except Exception as e:
-                print(f"⚠️  Could not parse hearing date: {e}")
+                log.warning("⚠️  Could not parse hearing date: %s", e)
         
         return result
     
@@ -262,7 +519,7 @@ class ECourtsScraper:
             # Note: PDF download URLs vary by court system
             pdf_url = f"{self.base_url}GetCasePDF"
             
-            print("\n📥 Attempting to download case PDF...")
+            log.info("📥 Attempting to download case PDF...")
             
             response = self.session.get(pdf_url, stream=True, timeout=30)
             
@@ -270,33 +527,39 @@ class ECourtsScraper:
                 content_type = response.headers.get('Content-Type', '')
                 if 'pdf' in content_type.lower():
                     filename = f"{output_dir}/{case_id.replace('/', '_')}.pdf"
+                    # Copy straight from the socket in 1 MiB reads; urllib3 still un-gzips
+                    response.raw.decode_content = True
                     with open(filename, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    print(f"✓ PDF downloaded: {filename}")
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                    log.info("✓ PDF downloaded: %s", filename)
                     return filename
                 else:
-                    print(f"⚠️  Response is not a PDF (Content-Type: {content_type})")
+                    log.warning("⚠️  Response is not a PDF (Content-Type: %s)", content_type)
                     return None
             else:
-                print(f"❌ PDF download failed: HTTP {response.status_code}")
+                log.warning("❌ PDF download failed: HTTP %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error downloading PDF: {e}")
+            log.warning("❌ Error downloading PDF: %s", e)
             return None
     
     def download_cause_list(self, state_code: str, dist_code: str, 
                            court_code: str, date: str = None, 
-                           output_dir: str = 'downloads') -> Optional[str]:
-        """Download entire cause list for specified date"""
+                           output_dir: str = 'downloads', jsonl: bool = False) -> Optional[str]:
+        """
+        Download entire cause list for specified date
+        
+        Saved as one indented JSON array, or with jsonl=True as JSON Lines
+        written row by row while the page is parsed.
+        """
         try:
             os.makedirs(output_dir, exist_ok=True)
             
             if not date:
                 date = datetime.now().strftime('%d-%m-%Y')
             
-            print(f"\n📥 Downloading cause list for {date}...")
+            log.info("📥 Downloading cause list for %s...", date)
             
             causelist_url = f"{self.base_url}ViewCauseList"
             
@@ -310,30 +573,65 @@ class ECourtsScraper:
             response = self.session.post(causelist_url, data=payload, timeout=30)
             
             if response.status_code == 200:
-                cause_list_data = self._parse_cause_list(response.text)
+                self._save_debug(f"causelist_{court_code}_{date}", response.content)
                 
-                filename = f"{output_dir}/causelist_{date.replace('/', '_').replace('-', '_')}.json"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(cause_list_data, f, indent=2, ensure_ascii=False)
+                # One file per court - app.py keeps each court's list warm separately
+                ext = 'jsonl' if jsonl else 'json'
+                name = _UNSAFE_FILENAME_RE.sub('_', f"{state_code}_{dist_code}_{court_code}_{date}")
+                filename = f"{output_dir}/causelist_{name.replace('-', '_')}.{ext}"
                 
-                print(f"✓ Cause list saved: {filename}")
+                # Raw bytes - let lxml sniff the encoding instead of requests' chardet pass
+                if jsonl:
+                    count = _write_jsonl(filename, (entry._asdict() for entry in
+                                                    self._iter_cause_list(response.content)))
+                    log.info("✓ Parsed %d cases from cause list", count)
+                else:
+                    cause_list_data = self._parse_cause_list(response.content)
+                    _write_json(filename, [entry._asdict() for entry in cause_list_data])
+                
+                log.info("✓ Cause list saved: %s", filename)
                 return filename
             else:
-                print(f"❌ Failed to fetch cause list: HTTP {response.status_code}")
+                log.warning("❌ Failed to fetch cause list: HTTP %s", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error downloading cause list: {e}")
+            log.warning("❌ Error downloading cause list: %s", e)
             return None
     
-    def _parse_cause_list(self, html_content: str) -> List[Dict]:
+    def _parse_cause_list(self, html_content: bytes) -> List[CauseEntry]:
         """Parse cause list from HTML"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        cases = []
+        cases = list(self._iter_cause_list(html_content))
         
-        # Save for debugging
-        with open('debug_causelist.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        log.info("✓ Parsed %d cases from cause list", len(cases))
+        return cases
+    
+    def _iter_cause_list(self, html_content: bytes) -> Iterator[CauseEntry]:
+        """Cause list rows one at a time, in page order"""
+        if HTMLParser is not None:
+            return self._iter_cause_list_selectolax(html_content)
+        return self._iter_cause_list_bs4(html_content)
+    
+    def _iter_cause_list_selectolax(self, html_content: bytes) -> Iterator[CauseEntry]:
+        """Cause list rows via selectolax - a shallow table walk doesn't need a full soup"""
+        tree = HTMLParser(html_content)
+        
+        for table in tree.css('table'):
+            for row in table.css('tr')[1:]:  # Skip header
+                cells = row.css('td')
+                if len(cells) >= 2:
+                    case_number = cells[1].text(strip=True)
+                    if case_number:  # Only add if has case number
+                        yield CauseEntry(
+                            cells[0].text(strip=True),
+                            case_number,
+                            cells[2].text(strip=True) if len(cells) > 2 else '',
+                            cells[3].text(strip=True) if len(cells) > 3 else '',
+                        )
+    
+    def _iter_cause_list_bs4(self, html_content: bytes) -> Iterator[CauseEntry]:
+        """Cause list rows via BeautifulSoup, used when selectolax isn't installed"""
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=_TABLES_ONLY)
         
         tables = soup.find_all('table')
         
@@ -342,26 +640,36 @@ class ECourtsScraper:
             for row in rows:
                 cells = row.find_all('td')
                 if len(cells) >= 2:
-                    case_entry = {
-                        'serial_no': cells[0].get_text(strip=True) if len(cells) > 0 else '',
-                        'case_number': cells[1].get_text(strip=True) if len(cells) > 1 else '',
-                        'parties': cells[2].get_text(strip=True) if len(cells) > 2 else '',
-                        'purpose': cells[3].get_text(strip=True) if len(cells) > 3 else '',
-                    }
-                    if case_entry['case_number']:  # Only add if has case number
-                        cases.append(case_entry)
+                    case_number = _text(cells[1])
+                    if case_number:  # Only add if has case number
+                        yield CauseEntry(
+                            _text(cells[0]),
+                            case_number,
+                            _text(cells[2]) if len(cells) > 2 else '',
+                            _text(cells[3]) if len(cells) > 3 else '',
+                        )
+    
+    def _save_debug(self, name: str, content) -> Optional[str]:
+        """Write a raw response to debug_<name>.html when debugging is on"""
+        if not self.debug:
+            return None
         
-        print(f"✓ Parsed {len(cases)} cases from cause list")
-        return cases
+        # One file per case/court so concurrent searches don't overwrite each other
+        debug_file = f"debug_{_UNSAFE_FILENAME_RE.sub('_', name)}.html"
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        with open(debug_file, 'wb') as f:
+            f.write(content)
+        log.info("💾 Response saved to %s for inspection", debug_file)
+        return debug_file
     
     def save_results(self, data: Dict, filename: str = 'results.json'):
         """Save results to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"✓ Results saved to: {filename}")
+            _write_json(filename, data)
+            log.info("✓ Results saved to: %s", filename)
         except Exception as e:
-            print(f"❌ Error saving results: {e}")
+            log.warning("❌ Error saving results: %s", e)
 
 
 def main():
@@ -375,6 +683,9 @@ Examples:
   
   # Search by case number
   python ecourts_scraper.py --case-number CS 123 2024 --state DL --dist 01
+  
+  # Search many CNRs at once (one per line)
+  python ecourts_scraper.py --cnr-file cnrs.txt --state DL --today
         """
     )
     
@@ -382,6 +693,7 @@ Examples:
     search_group.add_argument('--cnr', help='CNR number of the case')
     search_group.add_argument('--case-number', nargs=3, metavar=('TYPE', 'NO', 'YEAR'),
                             help='Case type, number, and year')
+    search_group.add_argument('--cnr-file', help='File of CNR numbers to search, one per line')
     
     parser.add_argument('--state', required=True, help='State code (e.g., DL)')
     parser.add_argument('--dist', help='District code')
@@ -393,12 +705,22 @@ Examples:
     parser.add_argument('--download-pdf', action='store_true', help='Download case PDF')
     parser.add_argument('--causelist', action='store_true', help='Download cause list')
     parser.add_argument('--court', help='Court code')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Save the cause list as JSON Lines, one case per line')
     parser.add_argument('--output', default='results.json', help='Output file')
     parser.add_argument('--output-dir', default='downloads', help='Download directory')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Log each step of the scrape to stderr')
+    parser.add_argument('--debug', action='store_true',
+                        help='Save raw eCourts responses to debug_*.html (or set ECOURTS_DEBUG=1)')
     
     args = parser.parse_args()
     
-    scraper = ECourtsScraper()
+    # Progress is logged at INFO - shown only with --verbose; warnings always
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s %(message)s')
+    
+    scraper = ECourtsScraper(debug=args.debug)
     
     print("=" * 70)
     print("⚖️  eCourts Scraper v2.0")
@@ -412,6 +734,30 @@ Examples:
         'downloads': []
     }
     
+    # Batch search - one result per CNR, listing checked for each
+    if args.cnr_file:
+        with open(args.cnr_file, encoding='utf-8') as f:
+            cnrs = [line.strip() for line in f if line.strip()]
+        
+        results['query'] = {'type': 'cnr_file', 'file': args.cnr_file, 'cnrs': cnrs}
+        results['cases'] = scraper.search_cnrs(args.state, cnrs)
+        
+        print("\n" + "=" * 70)
+        print(f"📋 CASE INFORMATION - {len(cnrs)} CNRs")
+        print("=" * 70)
+        for case_info in results['cases']:
+            if args.today or args.tomorrow:
+                check_date = 'tomorrow' if args.tomorrow else 'today'
+                case_info['listing_info'] = scraper.check_listing(case_info, check_date)
+            
+            status = '✓' if case_info['found'] else '✗'
+            if case_info['listing_info'] and case_info['listing_info']['is_listed']:
+                status += ' (listed)'
+            print(f"{case_info['case_id']}: {status} {case_info.get('error') or case_info.get('court_name') or ''}")
+        
+        scraper.save_results(results, args.output)
+        return
+    
     # Search
     if args.cnr:
         results['query'] = {'type': 'cnr', 'cnr': args.cnr}
@@ -475,7 +821,7 @@ Examples:
     
     if args.causelist and args.dist and args.court:
         cl_file = scraper.download_cause_list(
-            args.state, args.dist, args.court, output_dir=args.output_dir
+            args.state, args.dist, args.court, output_dir=args.output_dir, jsonl=args.jsonl
         )
         if cl_file:
             results['downloads'].append({'type': 'causelist', 'file': cl_file})
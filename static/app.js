@@ -0,0 +1,163 @@
+// Tab switching
+document.querySelectorAll('.tab').forEach(tab => {
+    tab.addEventListener('click', function() {
+        document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+        document.querySelectorAll('.form-section').forEach(s => s.classList.remove('active'));
+
+        this.classList.add('active');
+        document.getElementById(this.dataset.tab + '-section').classList.add('active');
+    });
+});
+
+// Form submission
+document.getElementById('searchForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+
+    const formData = new FormData(this);
+    const data = {};
+
+    // Get active tab
+    const activeTab = document.querySelector('.tab.active').dataset.tab;
+    data.searchType = activeTab;
+
+    // Collect form data
+    for (let [key, value] of formData.entries()) {
+        if (key === 'downloadPdf' || key === 'downloadCauseList') {
+            data[key] = true;
+        } else if (key === 'checkDate') {
+            data[key] = value;
+        } else if (value.trim()) {
+            data[key] = value.trim();
+        }
+    }
+
+    // Show loading
+    document.getElementById('loading').classList.add('show');
+    document.getElementById('results').classList.remove('show');
+    document.getElementById('submitBtn').disabled = true;
+
+    try {
+        const response = await fetch('/api/search', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(data)
+        });
+
+        const job = await response.json();
+
+        // Poll the job until the scrape finishes
+        const result = job.job_id ? await pollJob(job.job_id) : job;
+
+        // Hide loading
+        document.getElementById('loading').classList.remove('show');
+        document.getElementById('submitBtn').disabled = false;
+
+        // Show results
+        displayResults(result);
+
+    } catch (error) {
+        document.getElementById('loading').classList.remove('show');
+        document.getElementById('submitBtn').disabled = false;
+        displayError('Failed to connect to server: ' + error.message);
+    }
+});
+
+async function pollJob(jobId) {
+    while (true) {
+        await new Promise(resolve => setTimeout(resolve, 2000));
+
+        const response = await fetch('/api/status/' + jobId);
+        const status = await response.json();
+
+        if (status.state === 'SUCCESS') {
+            return status.result;
+        }
+        if (status.state === 'FAILURE' || status.error) {
+            return {error: status.error || 'Search job failed'};
+        }
+    }
+}
+
+function addRow(frag, label, value, status) {
+    const row = document.getElementById('row-template').content.cloneNode(true);
+    row.querySelector('.result-label').textContent = label;
+    const valueEl = row.querySelector('.result-value');
+    valueEl.textContent = value;
+    if (status) {
+        valueEl.classList.add(status);
+    }
+    frag.appendChild(row);
+}
+
+function addHeader(frag, text, spaced) {
+    const header = document.createElement('div');
+    header.className = 'result-header';
+    if (spaced) {
+        header.style.marginTop = '20px';
+    }
+    header.textContent = text;
+    frag.appendChild(header);
+}
+
+function buildAlert(kind, title) {
+    const alert = document.getElementById('alert-template').content.firstElementChild.cloneNode(true);
+    alert.classList.add('alert-' + kind);
+    alert.querySelector('strong').textContent = title;
+    return alert;
+}
+
+function displayResults(data) {
+    const resultsDiv = document.getElementById('results');
+
+    if (data.error) {
+        displayError(data.error);
+        return;
+    }
+
+    const frag = document.createDocumentFragment();
+    addHeader(frag, 'Search Results');
+
+    if (data.case_info) {
+        const info = data.case_info;
+        addRow(frag, 'Case ID:', info.case_id);
+        addRow(frag, 'Found:', info.found ? '✓ Yes' : '✗ No', info.found ? 'success' : 'error');
+
+        if (info.court_name) {
+            addRow(frag, 'Court:', info.court_name);
+        }
+
+        if (info.serial_number) {
+            addRow(frag, 'Serial Number:', info.serial_number);
+        }
+    }
+
+    if (data.listing_info) {
+        const listing = data.listing_info;
+        addHeader(frag, 'Listing Status', true);
+        addRow(frag, 'Check Date:', listing.check_date);
+        addRow(frag, 'Listed:', listing.is_listed ? '✓ Yes' : '✗ No', listing.is_listed ? 'success' : 'error');
+    }
+
+    if (data.downloads && data.downloads.length > 0) {
+        const alert = buildAlert('success', 'Downloads:');
+        alert.style.marginTop = '20px';
+        data.downloads.forEach(d => {
+            alert.appendChild(document.createElement('br'));
+            alert.appendChild(document.createTextNode(`${d.type}: ${d.file}`));
+        });
+        frag.appendChild(alert);
+    }
+
+    resultsDiv.replaceChildren(frag);
+    resultsDiv.classList.add('show');
+}
+
+function displayError(message) {
+    const resultsDiv = document.getElementById('results');
+    const alert = buildAlert('error', 'Error:');
+    alert.appendChild(document.createTextNode(' ' + message));
+    resultsDiv.replaceChildren(alert);
+    resultsDiv.classList.add('show');
+}
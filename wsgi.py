@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+eCourts Scraper - WSGI entry point for production servers
+
+    gunicorn -k gevent -w 1 --worker-connections=1000 -b 0.0.0.0:3000 wsgi:app
+
+Search jobs and their results are kept inside the worker process, so run a
+single gevent worker - it holds hundreds of in-flight scrapes on green threads.
+"""
+
+# Patch sockets/threads before requests is imported so network calls yield
+from gevent import monkey
+monkey.patch_all()
+
+from werkzeug.middleware.proxy_fix import ProxyFix  # noqa: E402
+
+from app import app  # noqa: E402
+
+# nginx (deploy/nginx.conf) sits in front - take the client address from
+# X-Forwarded-For so per-client rate limits apply to real clients
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)